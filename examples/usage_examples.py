@@ -6,7 +6,7 @@ This file demonstrates how to use the volcanoes package for various
 volcano data analysis tasks.
 """
 
-from volcanoes import GVP
+from volcanoes import GVP, VolcanoSet
 import matplotlib
 # matplotlib.use('TkAgg')  # or 'Qt5Agg', depending on what's available
 
@@ -170,16 +170,11 @@ def main():
     print(f"Countries with volcanoes: {len(countries)}")
 
     # Show countries with most volcanoes
-    country_counts = []
-    for country in countries[:]:  # Check first n countries
-        count = len(gvp.filter_volcanoes(country=country, geologic_epoch="Holocene"))
-        country_counts.append((country, count))
-
-    # Sort by count
-    country_counts.sort(key=lambda x: x[1], reverse=True)
+    holocene = gvp.filter_volcanoes(geologic_epoch="Holocene")
+    country_counts = holocene.counts_by_country()
 
     print("\nTop 10 countries by Holocene volcano count:")
-    for country, count in country_counts[:10]:
+    for country, count in country_counts.most_common(10):
         print(f"  {country}: {count} volcanoes")
 
     # Example 13: Data exploration
@@ -187,12 +182,13 @@ def main():
     print("EXAMPLE 13: Data Quality Check")
     print("=" * 50)
 
-    all_volcanoes = gvp.volcanoes
+    all_volcanoes = VolcanoSet(gvp.volcanoes)
 
     # Check data completeness
-    with_coords = len([v for v in all_volcanoes if v.lat is not None and v.lon is not None])
-    with_elevation = len([v for v in all_volcanoes if v.get_elevation() is not None])
-    with_last_eruption = len([v for v in all_volcanoes if v.last_eruption_year is not None])
+    completeness = all_volcanoes.completeness()
+    with_coords = completeness['with_coordinates']
+    with_elevation = completeness['with_elevation']
+    with_last_eruption = completeness['with_last_eruption']
 
     print(f"Total volcanoes: {len(all_volcanoes)}")
     print(f"With coordinates: {with_coords} ({with_coords / len(all_volcanoes) * 100:.1f}%)")
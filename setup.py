@@ -6,10 +6,16 @@ setup(
     packages=find_packages(),
     install_requires=[
         "matplotlib>=3.0.0",
+        "numpy>=1.17.0",
         "requests>=2.25.0",
     ],
     extras_require={
         'dev': ['pytest', 'pytest-cov', 'black', 'flake8'],
+        # Optional accelerators, used automatically when installed
+        'fast': ['numba', 'orjson'],
+        # CSV engines selected with engine='pandas' / engine='pyarrow'
+        'pandas': ['pandas'],
+        'pyarrow': ['pyarrow'],
     },
     author="Your Name",
     author_email="jwellik@usgs.gov",
@@ -0,0 +1,104 @@
+# tests/test_eruption_set.py
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from volcanoes import EruptionSet
+from volcanoes.utils.csv_reader import HAS_PANDAS, HAS_PYARROW
+
+CSV_TEXT = """﻿VolcanoNumber , EruptionNumber,VolcanoName,StartYear,VEI
+211020,10001, Vesuvius ,1944,3
+211060,10002,Etna,2024,
+211020,10003,Vesuvius,79,5
+
+,10004,Unknown,,
+"""
+
+
+class TestEruptionSet(unittest.TestCase):
+    def setUp(self):
+        fd, self.csv_path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(CSV_TEXT)
+        self.eruptions = EruptionSet.from_csv(self.csv_path)
+
+    def tearDown(self):
+        os.remove(self.csv_path)
+
+    def test_from_csv(self):
+        self.assertEqual(len(self.eruptions), 4)
+        first = self.eruptions[0]
+        self.assertEqual(first.volcano_number, 211020)
+        self.assertEqual(first['VolcanoName'], 'Vesuvius')
+        self.assertEqual(first['StartYear'], 1944.0)
+        self.assertEqual(first['VEI'], 3.0)
+        self.assertEqual(self.eruptions[1]['VEI'], '')
+        self.assertEqual(self.eruptions[3]['VolcanoNumber'], '')
+
+    def test_from_csv_parallel(self):
+        parallel = EruptionSet.from_csv(self.csv_path, workers=2)
+        self.assertEqual([e.get_field('VolcanoName') for e in parallel],
+                         [e.get_field('VolcanoName') for e in self.eruptions])
+
+    @unittest.skipUnless(HAS_PANDAS, "pandas is not installed")
+    def test_from_csv_pandas(self):
+        from_pandas = EruptionSet.from_csv(self.csv_path, engine='pandas')
+        self.assertEqual([e._data for e in from_pandas], [e._data for e in self.eruptions])
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_from_csv_pyarrow(self):
+        from_pyarrow = EruptionSet.from_csv(self.csv_path, engine='pyarrow')
+        self.assertEqual([e._data for e in from_pyarrow], [e._data for e in self.eruptions])
+
+    def test_from_csv_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            EruptionSet.from_csv(self.csv_path, engine='arrow')
+
+    def test_print(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.eruptions.print(limit=3)
+        self.assertEqual(out.getvalue().splitlines()[2:], [
+            '  1. Volcano #211020',
+            '  2. Volcano #211060',
+            '  3. Volcano #211020',
+            '... and 1 more',
+        ])
+
+    def test_filter_by_volcano_number(self):
+        vesuvius = self.eruptions.filter_by_volcano_number(211020)
+        self.assertEqual([e.eruption_number for e in vesuvius], [10001, 10003])
+        self.assertEqual(len(self.eruptions.filter_by_volcano_number(1)), 0)
+
+    def test_filter_by_year_range(self):
+        self.assertEqual([e.eruption_number for e in self.eruptions.filter_by_year_range(1900)], [10001, 10002])
+        self.assertEqual([e.eruption_number for e in self.eruptions.filter_by_year_range(max_year=1944)],
+                         [10001, 10003])
+        self.assertEqual([e.eruption_number for e in self.eruptions.filter_by_year_range(100, 2000)], [10001])
+        self.assertEqual(len(self.eruptions.filter_by_year_range(3000)), 0)
+
+    def test_filter_by_vei(self):
+        self.assertEqual([e.eruption_number for e in self.eruptions.filter_by_vei(4)], [10003])
+        self.assertEqual([e.eruption_number for e in self.eruptions.filter_by_vei(max_vei=5)], [10001, 10003])
+        # Eruptions without a VEI never match, even with no bounds
+        self.assertEqual([e.eruption_number for e in self.eruptions.filter_by_vei()], [10001, 10003])
+        filtered = self.eruptions[1:].filter_by_vei(3)
+        self.assertEqual([e.eruption_number for e in filtered], [10003])
+        self.assertEqual([e.eruption_number for e in filtered.filter_by_year_range(0)], [10003])
+
+    def test_summary_stats(self):
+        self.assertEqual(self.eruptions.get_volcano_numbers(), [211020, 211060])
+        self.assertEqual(self.eruptions.summary_stats(), {'total_eruptions': 4, 'unique_volcanoes': 2})
+
+    def test_slices_are_views(self):
+        self.eruptions.get_volcano_numbers()
+        tail = self.eruptions[1:]
+        self.assertEqual([e.eruption_number for e in tail], [10002, 10003, 10004])
+        self.assertEqual([e.eruption_number for e in tail[::2]], [10002, 10004])
+        self.assertEqual([e.eruption_number for e in tail.filter_by_volcano_number(211020)], [10003])
+        self.assertIsInstance(tail.eruptions, list)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,15 @@
 # tests/test_gvp.py
+import contextlib
 import unittest
 import tempfile
 import os
 import shutil
+from datetime import datetime
 from pathlib import Path
-from volcanoes import GVP
+from unittest import mock
+from volcanoes import GVP, GVPDownloader
+from volcanoes.utils.csv_reader import HAS_PANDAS, HAS_PYARROW
+from volcanoes.utils.distance import HAS_NUMBA
 
 
 class TestGVP(unittest.TestCase):
@@ -26,5 +31,289 @@ class TestGVP(unittest.TestCase):
         self.assertGreater(len(italy), 0)
 
 
+SAMPLE_CSV = """Volcano_Number,Volcano_Name,Country,Primary_Volcano_Type,Geologic_Epoch,Latitude,Longitude,Elevation,Last_Eruption_Year
+211060,Etna,Italy,Stratovolcano,Holocene,37.748,14.999,3357,2024
+211020,Vesuvius,Italy,Somma,Holocene,40.821,14.426,1281,1944
+211040,Stromboli,Italy,Stratovolcano,Holocene,38.789,15.213,924,2024
+263250,Merapi,Indonesia,Stratovolcano,Holocene,-7.54,110.446,2910,2023
+999999,Nowhere,Unknown,Caldera,Pleistocene,,,,
+"""
+
+
+class TestGVPLocalCSV(unittest.TestCase):
+    def setUp(self):
+        self.test_cache_dir = tempfile.mkdtemp(prefix='volcanoes_test_cache_')
+        csv_path = os.path.join(self.test_cache_dir, 'volcanoes.csv')
+        with open(csv_path, 'w', encoding='utf-8') as f:
+            f.write(SAMPLE_CSV)
+        self.gvp = GVP(csv_path=csv_path, cache_dir=self.test_cache_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_cache_dir, ignore_errors=True)
+
+    def names(self, **kwargs):
+        return [v.name for v in self.gvp.filter_volcanoes(**kwargs)]
+
+    def test_filter_volcanoes(self):
+        self.assertEqual(self.names(), ['Etna', 'Vesuvius', 'Stromboli', 'Merapi', 'Nowhere'])
+        self.assertEqual(self.names(country="ital"), ['Etna', 'Vesuvius', 'Stromboli'])
+        self.assertEqual(self.names(name="STROM"), ['Stromboli'])
+        self.assertEqual(self.names(id=263250), ['Merapi'])
+        self.assertEqual(self.names(id=263250, country="Italy"), [])
+        self.assertEqual(self.names(id=211020, name="vesu", min_elevation=1000), ['Vesuvius'])
+        self.assertEqual(self.names(volcano_type="strato", country="Italy"), ['Etna', 'Stromboli'])
+        self.assertEqual(self.names(geologic_epoch="pleist"), ['Nowhere'])
+        self.assertEqual(self.names(min_elevation=1000), ['Etna', 'Vesuvius', 'Merapi'])
+        self.assertEqual(self.names(min_elevation=1000, max_elevation=3000), ['Vesuvius', 'Merapi'])
+        self.assertEqual(self.names(country="Italy", latitude=38.0, longitude=15.0, radius_km=200),
+                         ['Etna', 'Stromboli'])
+
+        # Repeated criteria reuse the memoized result, but each caller gets its own set
+        first = self.gvp.filter_volcanoes(country="Italy", min_elevation=1000)
+        cached = len(self.gvp._volcano_set()._filter_cache)
+        again = self.gvp.filter_volcanoes(country="ITALY", min_elevation=1000)
+        self.assertEqual(len(self.gvp._volcano_set()._filter_cache), cached)
+        self.assertIsNot(again, first)
+        first.volcanoes.clear()
+        self.assertEqual([v.name for v in again], ['Etna', 'Vesuvius'])
+        self.assertEqual(self.names(country="Italy", min_elevation=1000), ['Etna', 'Vesuvius'])
+        # Nothing to filter: changing the result does not change the GVP's data
+        self.gvp.filter_volcanoes().volcanoes.pop()
+        self.assertEqual(len(self.gvp.volcanoes), 5)
+        self.assertEqual(len(self.gvp.filter_volcanoes()), 5)
+        self.assertEqual(len(self.gvp.filter_volcanoes(country="Italy")), 3)
+
+    def test_volcanoes_returns_copy(self):
+        self.assertEqual(len(self.gvp.filter_volcanoes(country="Italy")), 3)
+        volcanoes = self.gvp.volcanoes
+        volcanoes.append(volcanoes[0])
+        del volcanoes[1]
+        self.assertEqual(len(self.gvp.volcanoes), 5)
+        self.assertEqual(self.names(country="Italy"), ['Etna', 'Vesuvius', 'Stromboli'])
+        self.assertEqual(self.gvp.stats()['total_volcanoes'], 5)
+
+    def test_filter_volcanoes_fractional_elevation(self):
+        csv_path = os.path.join(self.test_cache_dir, 'fractional.csv')
+        with open(csv_path, 'w', encoding='utf-8') as f:
+            f.write(SAMPLE_CSV.replace(',1281,', ',1000.3,'))
+        # The numba kernel (when installed) and the NumPy comparisons agree
+        # with filter_by_elevation_range at full precision
+        for kernel in ('numba', 'numpy'):
+            if kernel == 'numba' and not HAS_NUMBA:
+                continue
+            with self.subTest(kernel=kernel):
+                gvp = GVP(csv_path=csv_path, cache_dir=self.test_cache_dir)
+                with (mock.patch('volcanoes.core.volcano_set._elevation_mask_kernel', return_value=None)
+                      if kernel == 'numpy' else contextlib.nullcontext()):
+                    self.assertEqual([v.name for v in gvp.filter_volcanoes(min_elevation=1000.3, max_elevation=3000)],
+                                     ['Vesuvius', 'Merapi'])
+                    self.assertEqual([v.name for v in gvp.filter_volcanoes(min_elevation=1000.30001)], ['Etna', 'Merapi'])
+                self.assertEqual([v.name for v in gvp._volcano_set().filter_by_elevation_range(1000.3, 3000)],
+                                 ['Vesuvius', 'Merapi'])
+
+    def test_filter_volcanoes_by_distance(self):
+        self.assertEqual(self.names(latitude=38.0, longitude=15.0, radius_km=300), ['Etna', 'Stromboli'])
+        self.assertEqual(self.names(latitude=38.0, longitude=15.0),
+                         ['Etna', 'Stromboli', 'Vesuvius', 'Merapi', 'Nowhere'])
+        self.assertEqual(self.names(min_elevation=1000, latitude=38.0, longitude=15.0),
+                         ['Etna', 'Vesuvius', 'Merapi'])
+
+    def test_get_volcano_by_id(self):
+        self.assertEqual(self.gvp.get_volcano_by_id(211020).name, 'Vesuvius')
+        self.assertIsNone(self.gvp.get_volcano_by_id(1))
+
+    def test_reload_reuses_parsed_file(self):
+        again = GVP(csv_path=self.gvp.csv_path, cache_dir=self.test_cache_dir)
+        # Same Volcano objects, but each instance has its own list of them
+        self.assertTrue(all(a is b for a, b in zip(again.volcanoes, self.gvp.volcanoes)))
+        self.gvp.volcanoes.pop()
+        self.assertEqual(len(again.volcanoes), 5)
+        self.assertEqual(len(GVP(csv_path=self.gvp.csv_path, cache_dir=self.test_cache_dir).volcanoes), 5)
+        # Another engine parses the file itself
+        if HAS_PANDAS:
+            with_pandas = GVP(csv_path=self.gvp.csv_path, cache_dir=self.test_cache_dir, engine='pandas')
+            self.assertIsNot(with_pandas.volcanoes[0], again.volcanoes[0])
+            self.assertEqual([v._data for v in with_pandas.volcanoes], [v._data for v in again.volcanoes])
+        with open(self.gvp.csv_path, 'a', encoding='utf-8') as f:
+            f.write("211030,Vulcano,Italy,Stratovolcano,Holocene,38.404,14.962,500,1890\n")
+        changed = GVP(csv_path=self.gvp.csv_path, cache_dir=self.test_cache_dir)
+        self.assertEqual(len(changed.volcanoes), 6)
+        GVP.clear_parsed_cache()
+        reparsed = GVP(csv_path=self.gvp.csv_path, cache_dir=self.test_cache_dir)
+        self.assertIsNot(reparsed.volcanoes[0], changed.volcanoes[0])
+        with mock.patch('volcanoes.core.gvp.PARSED_CSV_CACHE_SIZE', 0):
+            uncached = GVP(csv_path=self.gvp.csv_path, cache_dir=self.test_cache_dir)
+            self.assertIsNot(uncached.volcanoes[0], reparsed.volcanoes[0])
+            self.assertIsNot(GVP(csv_path=self.gvp.csv_path, cache_dir=self.test_cache_dir).volcanoes[0],
+                             uncached.volcanoes[0])
+
+    def test_export_to_csv_round_trip(self):
+        output_path = os.path.join(self.test_cache_dir, 'exported.csv')
+        self.gvp.export_to_csv(output_path)
+        exported = GVP(csv_path=output_path, cache_dir=self.test_cache_dir)
+        self.assertEqual([v._data for v in exported.volcanoes], [v._data for v in self.gvp.volcanoes])
+
+    def test_lazy_loading(self):
+        lazy = GVP(csv_path=self.gvp.csv_path, cache_dir=self.test_cache_dir, lazy=True)
+        self.assertEqual(len(lazy.volcanoes), 5)
+        self.assertEqual(lazy.volcanoes[3].name, 'Merapi')
+        self.assertIs(lazy.volcanoes[3], lazy.volcanoes[3])
+        self.assertEqual([v.name for v in lazy.filter_volcanoes(country="Italy", min_elevation=1000)],
+                         ['Etna', 'Vesuvius'])
+        self.assertEqual([v._data for v in lazy.volcanoes], [v._data for v in self.gvp.volcanoes])
+        lazy.close()
+        self.assertTrue(lazy.volcanoes._records._file.closed)
+
+    def test_context_manager_closes_lazy_records(self):
+        with GVP(csv_path=self.gvp.csv_path, cache_dir=self.test_cache_dir, lazy=True) as lazy:
+            records = lazy.volcanoes._records
+            self.assertEqual(lazy.volcanoes[0].name, 'Etna')
+        self.assertTrue(records._file.closed)
+        # Reloading closes the records of the previous load
+        with GVP(csv_path=self.gvp.csv_path, cache_dir=self.test_cache_dir, lazy=True) as lazy:
+            records = lazy.volcanoes._records
+            lazy._load_data()
+            self.assertTrue(records._file.closed)
+            self.assertFalse(lazy.volcanoes._records._file.closed)
+
+    def test_countries_and_types(self):
+        self.assertEqual(self.gvp.get_countries(), ['Indonesia', 'Italy', 'Unknown'])
+        self.assertEqual(self.gvp.get_volcano_types(), ['Caldera', 'Somma', 'Stratovolcano'])
+        self.gvp.get_countries().clear()
+        self.assertEqual(self.gvp.stats()['countries'], 3)
+
+    def test_cache_info_is_reused_until_the_cache_changes(self):
+        downloader = self.gvp.downloader
+        info = downloader.get_cache_info('holocene_volcanoes')
+        self.assertFalse(info['holocene_volcanoes']['cached'])
+        info['holocene_volcanoes']['cached'] = True
+        self.assertFalse(downloader.get_cache_info('holocene_volcanoes')['holocene_volcanoes']['cached'])
+
+        cache_path = downloader._get_cache_path('holocene_volcanoes')
+        shutil.copy(self.gvp.csv_path, cache_path)
+        downloader._save_metadata('holocene_volcanoes', datetime.now(), cache_path)
+        self.assertTrue(downloader.get_cache_info('holocene_volcanoes')['holocene_volcanoes']['cached'])
+        downloader.clear_cache('holocene_volcanoes')
+        self.assertFalse(downloader.get_cache_info('holocene_volcanoes')['holocene_volcanoes']['cached'])
+
+
+class _FakeResponse:
+    def __init__(self, chunks, status_code=200, headers=None):
+        self.chunks = chunks
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        return iter(self.chunks)
+
+
+class _FakeSession:
+    """Serves chunks with an ETag, and 304 Not Modified to a request for that ETag."""
+
+    def __init__(self, chunks, etag='"v1"'):
+        self.chunks = chunks
+        self.etag = etag
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        headers = headers or {}
+        self.requests.append(headers)
+        if headers.get('If-None-Match') == self.etag:
+            return _FakeResponse([], status_code=304)
+        return _FakeResponse(self.chunks, headers={'ETag': self.etag})
+
+    def close(self):
+        pass
+
+
+class TestGVPDownloader(unittest.TestCase):
+    def setUp(self):
+        self.test_cache_dir = tempfile.mkdtemp(prefix='volcanoes_test_cache_')
+        self.downloader = GVPDownloader(cache_dir=self.test_cache_dir)
+
+    def tearDown(self):
+        self.downloader.close()
+        shutil.rmtree(self.test_cache_dir, ignore_errors=True)
+
+    def test_download_data_streams_and_fixes_xml(self):
+        output_path = Path(self.test_cache_dir) / 'data.csv'
+        # "(< " split across chunks is still escaped
+        self.downloader._session = _FakeSession([b'a,b (', b'< 1)\nc,d (<', b' 2)\n'])
+        size, validators = self.downloader._download_data('https://example.invalid', output_path)
+        self.assertEqual(validators, {'etag': '"v1"'})
+        self.assertEqual(output_path.read_bytes(), b'a,b (&lt; 1)\nc,d (&lt; 2)\n')
+        self.assertEqual(size, output_path.stat().st_size)
+        self.assertEqual(os.listdir(self.test_cache_dir), ['data.csv'])
+
+    def test_download_many(self):
+        self.downloader._session = _FakeSession([b'a,b\n1,2\n'])
+        paths = self.downloader.download_many()
+        self.assertEqual(list(paths), list(GVPDownloader.DATASETS))
+        for path in paths.values():
+            self.assertEqual(path.read_bytes(), b'a,b\n1,2\n')
+        self.assertTrue(all(info['cached'] for info in self.downloader.get_cache_info().values()))
+        with self.assertRaises(ValueError):
+            self.downloader.download_many(['holocene_volcanoes', 'no_such_dataset'])
+        repeated = self.downloader.download_many(['holocene_volcanoes', 'holocene_volcanoes'],
+                                                 force_refresh=True)
+        self.assertEqual(list(repeated), ['holocene_volcanoes'])
+
+    def test_refresh_skips_unchanged_data(self):
+        session = self.downloader._session = _FakeSession([b'a,b\n1,2\n'])
+        path = self.downloader.download('holocene_volcanoes')
+        self.assertEqual(session.requests, [{}])
+        self.assertEqual(self.downloader._load_metadata('holocene_volcanoes')['etag'], '"v1"')
+
+        # Unchanged upstream: 304, and the cached file is kept
+        self.assertEqual(self.downloader.download('holocene_volcanoes', force_refresh=True), path)
+        self.assertEqual(session.requests[-1], {'If-None-Match': '"v1"'})
+        self.assertEqual(path.read_bytes(), b'a,b\n1,2\n')
+
+        # Changed upstream: downloaded again
+        session.etag, session.chunks = '"v2"', [b'a,b\n3,4\n']
+        self.downloader.download('holocene_volcanoes', force_refresh=True)
+        self.assertEqual(path.read_bytes(), b'a,b\n3,4\n')
+        self.assertEqual(self.downloader._load_metadata('holocene_volcanoes')['etag'], '"v2"')
+
+        # Expired cache is revalidated without force_refresh
+        self.downloader.max_age = 0
+        self.downloader.download('holocene_volcanoes')
+        self.assertEqual(session.requests[-1], {'If-None-Match': '"v2"'})
+
+    def test_export_to_csv_modes(self):
+        self.downloader._session = _FakeSession([b'a,b\n1,2\n'])
+        copy_path = Path(self.test_cache_dir) / 'copy.csv'
+        link_path = Path(self.test_cache_dir) / 'link.csv'
+        cache_path = self.downloader.export_to_csv('holocene_volcanoes')
+        self.downloader.export_to_csv('holocene_volcanoes', copy_path)
+        self.assertEqual(copy_path.read_bytes(), b'a,b\n1,2\n')
+        self.assertFalse(copy_path.samefile(cache_path))
+        for _ in range(2):
+            self.downloader.export_to_csv('holocene_volcanoes', link_path, mode='link')
+        self.assertTrue(link_path.samefile(cache_path))
+        self.assertFalse(Path(str(link_path) + '.part').exists())
+        with self.assertRaises(ValueError):
+            self.downloader.export_to_csv('holocene_volcanoes', copy_path, mode='symlink')
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_load_table_uses_parquet_sidecar(self):
+        self.downloader._session = _FakeSession([SAMPLE_CSV.encode('utf-8')])
+        table = self.downloader.load_table('holocene_volcanoes', columns=['Volcano_Name'])
+        self.assertEqual(table.column_names, ['Volcano_Name'])
+        self.assertTrue(self.downloader._get_cache_path('holocene_volcanoes', 'parquet').exists())
+        again = self.downloader.load_table('holocene_volcanoes', columns=['Volcano_Name', 'Country'])
+        self.assertEqual(again.column('Volcano_Name').to_pylist(), table.column('Volcano_Name').to_pylist())
+        self.assertEqual(again.num_rows, 5)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
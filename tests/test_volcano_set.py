@@ -0,0 +1,195 @@
+# tests/test_volcano_set.py
+import json
+import os
+import tempfile
+import unittest
+from volcanoes import Volcano, VolcanoSet
+
+
+def make_volcano(number, name, country, lat, lon, elev='', vtype='Stratovolcano', last=''):
+    return Volcano({
+        'Volcano_Number': str(number),
+        'Volcano_Name': name,
+        'Country': country,
+        'Primary_Volcano_Type': vtype,
+        'Latitude': str(lat),
+        'Longitude': str(lon),
+        'Elevation': str(elev),
+        'Last_Eruption_Year': str(last),
+    })
+
+
+class TestVolcanoSet(unittest.TestCase):
+    def setUp(self):
+        self.volcs = VolcanoSet([
+            make_volcano(211060, 'Etna', 'Italy', 37.748, 14.999, 3357, last=2024),
+            make_volcano(211020, 'Vesuvius', 'Italy', 40.821, 14.426, 1281, 'Somma', 1944),
+            make_volcano(211040, 'Stromboli', 'Italy', 38.789, 15.213, 924, last=2024),
+            make_volcano(263250, 'Merapi', 'Indonesia', -7.54, 110.446, 2910, last=2023),
+            make_volcano(999999, 'Nowhere', 'Unknown', '', ''),
+        ])
+
+    def test_sort_by_distance(self):
+        rome_lat, rome_lon = 41.9028, 12.4964
+        names = [v.name for v in self.volcs.sort_by_distance(rome_lat, rome_lon)]
+        self.assertEqual(names, ['Vesuvius', 'Stromboli', 'Etna', 'Merapi', 'Nowhere'])
+
+    def test_within_radius(self):
+        nearby = self.volcs.within_radius(40.8, 14.4, radius_km=300)
+        self.assertEqual([v.name for v in nearby], ['Vesuvius', 'Stromboli'])
+
+    def test_within_radius_sorted(self):
+        lat, lon = 38.0, 15.0
+        expected = [v.name for v in self.volcs.within_radius(lat, lon, 1000).sort_by_distance(lat, lon)]
+        self.assertEqual(expected, ['Etna', 'Stromboli', 'Vesuvius'])
+        self.assertEqual([v.name for v in self.volcs.within_radius(lat, lon, 1000, sort=True)], expected)
+
+    def test_within_radius_matches_distance_to(self):
+        lat, lon = 38.0, 15.0
+        located = self.volcs[:4]
+        for radius in (10, 100, 1000, 20000):
+            expected = [v.name for v in located if v.distance_to(lat, lon) <= radius]
+            self.assertEqual([v.name for v in located.within_radius(lat, lon, radius)], expected)
+        # Queries are not rounded: a point 3 cm from Etna is outside a 2 cm radius
+        lat = 37.748 + 3e-7
+        self.assertGreater(self.volcs[0].distance_to(lat, 14.999), 2e-5)
+        self.assertEqual(len(self.volcs.within_radius(lat, 14.999, 2e-5)), 0)
+        self.assertEqual([v.name for v in self.volcs.within_radius(lat, 14.999, 4e-5)], ['Etna'])
+
+    def test_distance_queries_share_distances(self):
+        lat, lon = 38.0, 15.0
+        by_distance = [v.name for v in self.volcs.sort_by_distance(lat, lon)]
+        self.assertEqual(len(self.volcs._distance_cache), 1)
+        # within_radius and nearest at the same point reuse the distance array
+        self.assertEqual([v.name for v in self.volcs.within_radius(lat, lon, 1000, sort=True)], by_distance[:3])
+        self.assertEqual([v.name for v in self.volcs.nearest(lat, lon, k=2)], by_distance[:2])
+        self.assertEqual(len(self.volcs._distance_cache), 1)
+
+    def test_nearest(self):
+        rome_lat, rome_lon = 41.9028, 12.4964
+        self.assertEqual([v.name for v in self.volcs.nearest(rome_lat, rome_lon)], ['Vesuvius'])
+        self.assertEqual([v.name for v in self.volcs.nearest(rome_lat, rome_lon, k=3)],
+                         ['Vesuvius', 'Stromboli', 'Etna'])
+        # Volcanoes without coordinates are never returned
+        self.assertEqual(len(self.volcs.nearest(rome_lat, rome_lon, k=10)), 4)
+        self.assertEqual(len(self.volcs.nearest(rome_lat, rome_lon, k=0)), 0)
+
+    def test_distance_to_arrays(self):
+        etna, nowhere = self.volcs[0], self.volcs[4]
+        lats, lons = [v.lat for v in self.volcs[:4]], [v.lon for v in self.volcs[:4]]
+        distances = etna.distance_to(lats, lons)
+        for d, lat, lon in zip(distances, lats, lons):
+            self.assertAlmostEqual(d, etna.distance_to(lat, lon), places=6)
+        self.assertTrue(all(d == float('inf') for d in nowhere.distance_to(lats, lons)))
+
+    def test_slices_are_views(self):
+        head = self.volcs[1:4]
+        self.assertEqual([v.name for v in head], ['Vesuvius', 'Stromboli', 'Merapi'])
+        self.assertEqual([v.name for v in head[::2]], ['Vesuvius', 'Merapi'])
+        self.assertEqual(head[-1].name, 'Merapi')
+        self.assertEqual([v.name for v in head.filter_by_country('Italy')], ['Vesuvius', 'Stromboli'])
+        self.assertIsInstance(head.volcanoes, list)
+        self.assertEqual(len(self.volcs[10:]), 0)
+
+    def test_volcanoes_returns_copy(self):
+        self.volcs.filter_by_country("Italy")
+        self.volcs.volcanoes.append(make_volcano(211010, 'Vulcano', 'Italy', 38.404, 14.962, 500))
+        self.assertEqual(len(self.volcs), 5)
+        self.assertEqual(len(self.volcs.filter_by_country("Italy")), 3)
+        self.assertEqual(len(self.volcs.filter_by_elevation_range(0, 5000)), 4)
+
+    def test_filter_by_country(self):
+        italy = self.volcs.filter_by_country("italy")
+        self.assertEqual([v.name for v in italy], ['Etna', 'Vesuvius', 'Stromboli'])
+        self.assertEqual(len(self.volcs.filter_by_country("France")), 0)
+
+    def test_filter_by_type(self):
+        self.assertEqual([v.name for v in self.volcs.filter_by_type("strato")],
+                         ['Etna', 'Stromboli', 'Merapi', 'Nowhere'])
+        self.assertEqual([v.name for v in self.volcs.filter_by_type("o")],
+                         ['Etna', 'Vesuvius', 'Stromboli', 'Merapi', 'Nowhere'])
+        self.assertEqual(len(self.volcs.filter_by_type("caldera")), 0)
+
+    def test_filter_results_are_memoized(self):
+        italy = self.volcs.filter_by_country("Italy")
+        again = self.volcs.filter_by_country("ITALY")
+        self.volcs.filter_by_country("Indonesia")
+        self.volcs.within_radius(40.8, 14.4, 300)
+        self.volcs.within_radius(40.8, 14.4, 300.0)
+        self.volcs.sort_by_distance(40.8, 14.4)
+        self.volcs.sort_by_distance(40.8, 14.4)
+        self.assertEqual(len(self.volcs._filter_cache), 4)
+        # Each call gets its own set over the memoized result
+        self.assertIsNot(again, italy)
+        self.assertEqual(list(again), list(italy))
+        italy.volcanoes.pop()
+        self.assertEqual([v.name for v in self.volcs.filter_by_country("Italy")], ['Etna', 'Vesuvius', 'Stromboli'])
+
+    def test_filter_by_elevation_range(self):
+        mid = self.volcs.filter_by_elevation_range(1000, 3000)
+        self.assertEqual([v.name for v in mid], ['Vesuvius', 'Merapi'])
+        # Bounds are compared at full precision
+        self.assertEqual([v.name for v in self.volcs.filter_by_elevation_range(1281.00001, 3000)], ['Merapi'])
+
+    def test_fractional_elevations(self):
+        volcs = VolcanoSet([make_volcano(1, 'A', 'X', 0, 0, 1000.3), make_volcano(2, 'B', 'X', 1, 1, 999.7)])
+        self.assertEqual(volcs.get_elevs(), [1000.3, 999.7])
+        self.assertEqual(volcs.summary_stats()['min_elevation'], 999.7)
+        self.assertEqual(volcs.summary_stats()['max_elevation'], 1000.3)
+        self.assertEqual([v.name for v in volcs.filter_by_elevation_range(1000.3, 2000)], ['A'])
+
+    def test_sort_by_elevation(self):
+        self.assertEqual([v.name for v in self.volcs.sort_by_elevation()],
+                         ['Etna', 'Merapi', 'Vesuvius', 'Stromboli', 'Nowhere'])
+        self.assertEqual([v.name for v in self.volcs.sort_by_elevation(reverse=False)],
+                         ['Nowhere', 'Stromboli', 'Vesuvius', 'Merapi', 'Etna'])
+        self.assertEqual(self.volcs.get_elevs(), [3357, 1281, 924, 2910])
+
+    def test_get_coordinates(self):
+        self.assertEqual(self.volcs.get_lats(), [37.748, 40.821, 38.789, -7.54])
+        self.assertEqual(self.volcs.get_lons(), [14.999, 14.426, 15.213, 110.446])
+        self.assertEqual(self.volcs[1:3].get_lats(), [40.821, 38.789])
+
+    def test_summary_stats(self):
+        stats = self.volcs.summary_stats()
+        self.assertEqual(stats['total_volcanoes'], 5)
+        self.assertEqual(stats['countries'], 3)
+        self.assertEqual(stats['volcano_types'], 2)
+        self.assertEqual(stats['max_elevation'], 3357)
+        self.assertEqual(stats['min_elevation'], 924)
+        self.assertAlmostEqual(stats['avg_elevation'], (3357 + 1281 + 924 + 2910) / 4)
+        # Distinct values are counted case-sensitively
+        mixed = VolcanoSet(self.volcs.volcanoes + [make_volcano(1, 'Vulcano', 'ITALY', 38.4, 14.96)])
+        self.assertEqual(mixed.summary_stats()['countries'], 4)
+        self.assertEqual(mixed.summary_stats()['volcano_types'], 2)
+
+    def test_counts(self):
+        self.assertEqual(self.volcs.counts_by_country().most_common(1), [('Italy', 3)])
+        self.assertEqual(self.volcs.counts_by_type(), {'Stratovolcano': 4, 'Somma': 1})
+
+    def test_completeness(self):
+        self.assertEqual(self.volcs.completeness(), {
+            'total_volcanoes': 5,
+            'with_coordinates': 4,
+            'with_elevation': 4,
+            'with_last_eruption': 4,
+        })
+
+    def test_export_to_geojson(self):
+        fd, path = tempfile.mkstemp(suffix='.geojson')
+        os.close(fd)
+        try:
+            self.volcs.export_to_geojson(path)
+            with open(path, encoding='utf-8') as f:
+                geojson = json.load(f)
+        finally:
+            os.remove(path)
+        self.assertEqual(geojson['type'], 'FeatureCollection')
+        # Volcanoes without coordinates are left out
+        self.assertEqual([f['properties']['Volcano_Name'] for f in geojson['features']],
+                         ['Etna', 'Vesuvius', 'Stromboli', 'Merapi'])
+        self.assertEqual(geojson['features'][0]['geometry'], {'type': 'Point', 'coordinates': [14.999, 37.748]})
+
+
+if __name__ == '__main__':
+    unittest.main()
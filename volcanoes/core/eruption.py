@@ -1,32 +1,72 @@
 """
 Eruption class for representing volcanic eruptions.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
+# Numeric fields and their types - we'll discover more as we work with the data
+NUMERIC_FIELDS = {
+    'VolcanoNumber': int,
+    'EruptionNumber': int,
+    'Year': float,
+    'StartYear': float,
+    'EndYear': float,
+    'Latitude': float,
+    'Longitude': float,
+    'VEI': float,
+}
+
+
+def _convert(value, cast):
+    """Convert value with cast, or return None if it cannot be converted."""
+    try:
+        return cast(value)
+    except (ValueError, TypeError):
+        return None
 
 
 class Eruption:
     """Represents a single volcanic eruption with all its properties."""
 
+    # No per-instance __dict__: a full dataset holds tens of thousands of eruptions
+    __slots__ = ('_data',)
+
     def __init__(self, data: Dict[str, Any]):
         """Initialize an Eruption object from a dictionary of data."""
         self._data = data
         self._process_data()
 
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> List['Eruption']:
+        """Create Eruptions from many data dictionaries at once.
+
+        Numeric fields are converted column by column, and each distinct raw
+        value (years and VEI repeat a lot) is converted only once.
+        """
+        for field, cast in NUMERIC_FIELDS.items():
+            converted = {}
+            for record in records:
+                raw = record.get(field, '')
+                if raw == '':
+                    continue
+                try:
+                    record[field] = converted[raw]
+                except KeyError:
+                    record[field] = converted[raw] = _convert(raw, cast)
+
+        eruptions = []
+        for record in records:
+            eruption = cls.__new__(cls)
+            eruption._data = record
+            eruptions.append(eruption)
+        return eruptions
+
     def _process_data(self):
         """Process and clean the raw data."""
-        # Convert numeric fields - we'll discover these as we work with the data
-        # Common fields that might be numeric
-        numeric_fields = ['VolcanoNumber', 'EruptionNumber', 'Year', 'StartYear', 
-                         'EndYear', 'Latitude', 'Longitude', 'VEI']
-        for field in numeric_fields:
-            if field in self._data and self._data[field] != '':
-                try:
-                    if field in ['VolcanoNumber', 'EruptionNumber']:
-                        self._data[field] = int(self._data[field])
-                    else:
-                        self._data[field] = float(self._data[field])
-                except (ValueError, TypeError):
-                    self._data[field] = None
+        data = self._data
+        for field, cast in NUMERIC_FIELDS.items():
+            value = data.get(field, '')
+            if value != '':
+                data[field] = _convert(value, cast)
 
     @property
     def volcano_number(self) -> Optional[int]:
@@ -1,25 +1,77 @@
 """
 EruptionSet class for collections of eruptions.
 """
-from typing import List, Optional, Union, Iterator
+from typing import Dict, List, Optional, Union, Iterator
+import sys
+
+import numpy as np
 from .eruption import Eruption
+from ..utils.csv_reader import read_csv_records
+from ..utils.views import ListView
+
+_NO_INDICES = np.empty(0, dtype=np.intp)
 
 
 class EruptionSet:
     """A collection of eruptions with filtering and analysis methods."""
 
+    __slots__ = ('_eruptions', '_columns', '_by_volcano')
+
     def __init__(self, eruptions: List[Eruption]):
         """Initialize with a list of Eruption objects."""
         self._eruptions = eruptions
+        # Numeric field -> float64 array (NaN where missing), built on first use
+        self._columns: Dict[str, np.ndarray] = {}
+        # Inverted index: volcano number -> indices of its eruptions, in ascending
+        # volcano number order; built on first use
+        self._by_volcano: Optional[Dict[int, np.ndarray]] = None
+
+    @classmethod
+    def from_csv(cls, csv_path: str, workers: int = 1, engine: str = 'csv') -> 'EruptionSet':
+        """Load an EruptionSet from a GVP eruption CSV file.
+
+        The header is cleaned once and numeric fields are converted column by
+        column via Eruption.from_records, instead of per row. With workers > 1
+        the rows of large files are parsed in that many processes, and
+        engine='pandas' tokenizes with pandas instead of the csv module.
+        """
+        _, records = read_csv_records(csv_path, workers=workers, engine=engine)
+        return cls(Eruption.from_records(records))
+
+    def _column(self, field: str) -> np.ndarray:
+        """Get a numeric field as a float64 array, with NaN for missing values."""
+        column = self._columns.get(field)
+        if column is None:
+            values = (e.get_field(field) for e in self._eruptions)
+            column = np.fromiter((np.nan if v is None or v == '' else v for v in values),
+                                 dtype=np.float64, count=len(self._eruptions))
+            self._columns[field] = column
+        return column
+
+    def _volcano_index(self) -> Dict[int, np.ndarray]:
+        """Get the volcano number -> eruption indices index, built with one stable sort."""
+        if self._by_volcano is None:
+            numbers = self._column('VolcanoNumber')
+            order = np.argsort(numbers, kind='stable')  # NaN (unknown) sorts last
+            known = np.count_nonzero(~np.isnan(numbers))
+            keys, starts = np.unique(numbers[order[:known]], return_index=True)
+            self._by_volcano = {int(k): idx for k, idx in zip(keys, np.split(order[:known], starts[1:]))}
+        return self._by_volcano
 
     def __len__(self) -> int:
         """Return the number of eruptions in the set."""
         return len(self._eruptions)
 
     def __getitem__(self, index: Union[int, slice]) -> Union[Eruption, 'EruptionSet']:
-        """Get eruption(s) by index."""
+        """Get eruption(s) by index.
+
+        Slices are views that share the underlying list rather than copying it.
+        """
         if isinstance(index, slice):
-            return EruptionSet(self._eruptions[index])
+            subset = EruptionSet(ListView(self._eruptions, index))
+            # Numeric columns built so far carry over as array views
+            subset._columns = {field: column[index] for field, column in self._columns.items()}
+            return subset
         return self._eruptions[index]
 
     def __iter__(self) -> Iterator[Eruption]:
@@ -29,37 +81,73 @@ class EruptionSet:
     @property
     def eruptions(self) -> List[Eruption]:
         """Get the list of eruptions."""
+        if not isinstance(self._eruptions, list):
+            # Materialize slice views on explicit request
+            self._eruptions = list(self._eruptions)
         return self._eruptions
 
+    def _take(self, idx: np.ndarray) -> 'EruptionSet':
+        """Create a new EruptionSet from an array of indices into this set."""
+        eruptions = self._eruptions
+        subset = EruptionSet([eruptions[i] for i in idx])
+        # Numeric columns built so far carry over
+        subset._columns = {field: column[idx] for field, column in self._columns.items()}
+        return subset
+
+    def _range_mask(self, field: str, low: Optional[float], high: Optional[float]) -> np.ndarray:
+        """Mask of eruptions whose numeric field is within [low, high].
+
+        A bound of None is open; eruptions missing the field never match.
+        """
+        column = self._column(field)
+        mask = ~np.isnan(column)
+        if low is not None:
+            mask &= column >= low
+        if high is not None:
+            mask &= column <= high
+        return mask
+
     def filter_by_volcano_number(self, volcano_number: int) -> 'EruptionSet':
         """Filter eruptions by volcano number."""
-        filtered = [e for e in self._eruptions if e.volcano_number == volcano_number]
-        return EruptionSet(filtered)
+        return self._take(self._volcano_index().get(volcano_number, _NO_INDICES))
+
+    def filter_by_year_range(self, min_year: Optional[float] = None,
+                             max_year: Optional[float] = None) -> 'EruptionSet':
+        """Filter eruptions by start year (negative years are BCE).
+
+        Either bound may be None; eruptions without a start year are left out.
+        """
+        return self._take(np.flatnonzero(self._range_mask('StartYear', min_year, max_year)))
+
+    def filter_by_vei(self, min_vei: Optional[float] = None,
+                      max_vei: Optional[float] = None) -> 'EruptionSet':
+        """Filter eruptions by Volcanic Explosivity Index (VEI).
+
+        Either bound may be None; eruptions without a VEI are left out.
+        """
+        return self._take(np.flatnonzero(self._range_mask('VEI', min_vei, max_vei)))
 
     def get_volcano_numbers(self) -> List[int]:
         """Get a list of unique volcano numbers."""
-        numbers = [e.volcano_number for e in self._eruptions if e.volcano_number is not None]
-        return sorted(list(set(numbers)))
+        return list(self._volcano_index())
 
     def print(self, limit: Optional[int] = None):
         """Print information about eruptions in the set."""
         eruptions_to_print = self._eruptions[:limit] if limit else self._eruptions
 
-        print(f"EruptionSet with {len(self._eruptions)} eruptions:")
-        print("-" * 80)
-
-        for i, eruption in enumerate(eruptions_to_print):
-            volcano_num = eruption.volcano_number if eruption.volcano_number else "Unknown"
-            print(f"{i + 1:3d}. Volcano #{volcano_num}")
+        # Build all lines first and write them in one call
+        lines = [f"EruptionSet with {len(self._eruptions)} eruptions:", "-" * 80]
+        lines.extend(f"{i + 1:3d}. Volcano #{eruption.volcano_number or 'Unknown'}"
+                     for i, eruption in enumerate(eruptions_to_print))
 
         if limit and len(self._eruptions) > limit:
-            print(f"... and {len(self._eruptions) - limit} more")
+            lines.append(f"... and {len(self._eruptions) - limit} more")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def summary_stats(self) -> dict:
         """Get summary statistics for the eruption set."""
-        volcano_numbers = [e.volcano_number for e in self._eruptions if e.volcano_number is not None]
-
         return {
             'total_eruptions': len(self._eruptions),
-            'unique_volcanoes': len(set(volcano_numbers)),
+            'unique_volcanoes': len(self.get_volcano_numbers()),
         }
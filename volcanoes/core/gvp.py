@@ -1,13 +1,79 @@
 # File: volcanoes/core/gvp.py
-import csv
+import heapq
+import logging
 import os
 import warnings
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Dict, Any, Tuple
+
+import numpy as np
+
 from .volcano import Volcano
 from .volcano_set import VolcanoSet
 from .eruption import Eruption
 from .eruption_set import EruptionSet
 from .gvp_downloader import GVPDownloader
+from ..utils.csv_reader import LazyCSVRecords, read_csv_records
+from ..utils.csv_writer import write_dict_rows
+from ..utils.geojson import write_feature_collection
+
+logger = logging.getLogger(__name__)
+
+# Volcanoes parsed from local CSV files, shared by GVP instances reading the same
+# unchanged file with the same engine: (absolute path, mtime in ns, size, engine)
+# -> tuple of Volcano objects. Each instance gets its own list of them. The
+# PARSED_CSV_CACHE_SIZE most recently used files are kept (0 disables the
+# cache); GVP.clear_parsed_cache() empties it.
+_PARSED_CSV_CACHE: 'OrderedDict[Tuple[str, int, int, str], Tuple[Volcano, ...]]' = OrderedDict()
+PARSED_CSV_CACHE_SIZE = 8
+
+# Shared empty list of volcanoes, so an unloaded GVP reuses one VolcanoSet
+_NO_VOLCANOES: List[Volcano] = []
+
+
+def _lower_or_none(value: Optional[str]) -> Optional[str]:
+    """Normalize a string filter criterion for use in a cache key."""
+    return value.lower() if value else None
+
+
+class _LazyVolcanoes(Sequence):
+    """Read-only sequence of Volcanoes created from CSV rows on first access.
+
+    Each Volcano is kept once created, so repeated access returns the same
+    object.
+    """
+
+    __slots__ = ('_records', '_cache')
+
+    def __init__(self, records: LazyCSVRecords):
+        self._records = records
+        self._cache: List[Optional[Volcano]] = [None] * len(records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        volcano = self._cache[index]
+        if volcano is None:
+            volcano = self._cache[index] = Volcano(self._records[index])
+        return volcano
+
+    def __iter__(self):
+        # Walk the cache directly instead of Sequence's index-until-IndexError loop
+        cache = self._cache
+        records = self._records
+        for i, volcano in enumerate(cache):
+            if volcano is None:
+                volcano = cache[i] = Volcano(records[i])
+            yield volcano
+
+    def close(self):
+        """Release the memory map and file handle of the CSV records."""
+        self._records.close()
 
 
 class GVP:
@@ -17,7 +83,10 @@ class GVP:
                  use_web_services: bool = False,
                  dataset: str = 'holocene_volcanoes',
                  cache_dir: Optional[str] = None,
-                 force_refresh: bool = False):
+                 force_refresh: bool = False,
+                 lazy: bool = False,
+                 workers: int = 1,
+                 engine: str = 'csv'):
         """Initialize the GVP database.
 
         Args:
@@ -26,13 +95,27 @@ class GVP:
             dataset: Dataset to download if using web services (deprecated, use get_volcanoes/get_eruptions instead).
             cache_dir: Directory for caching downloaded data. If None, uses default cache directory.
             force_refresh: If True and using web services, force a fresh download even if cached.
+            lazy: If True, index the rows of the local CSV file and only create each
+                Volcano when it is first accessed. Filters, lookups, statistics
+                and exports still create every Volcano on first use.
+            workers: Number of processes used to parse a local CSV file. Only
+                worth raising for very large files.
+            engine: CSV engine used to parse local CSV files: 'csv' (default),
+                'pandas' or 'pyarrow'. See read_csv_records.
         """
         self.use_web_services = use_web_services
         self.dataset = dataset  # Kept for backward compatibility
         self.downloader = None
         self.cache_dir = cache_dir
         self.force_refresh = force_refresh
+        self.lazy = lazy
+        self.workers = workers
+        self.engine = engine
         
+        self._all_volcanoes = None
+        self._countries = None
+        self._volcano_types = None
+
         # Initialize downloader (used for both web services and cached data)
         self.downloader = GVPDownloader(cache_dir=cache_dir)
         
@@ -51,10 +134,10 @@ class GVP:
                     self.csv_path = str(cache_path)
                     metadata = self.downloader._load_metadata('holocene_volcanoes')
                     if metadata:
-                        print(f"Using cached data (downloaded: {metadata['download_time']})")
+                        logger.info("Using cached data (downloaded: %s)", metadata['download_time'])
                 else:
                     # No cache exists, download it automatically
-                    print("No cached data found. Downloading Holocene volcanoes from GVP web services...")
+                    logger.info("No cached data found. Downloading Holocene volcanoes from GVP web services...")
                     cache_path = self.downloader.download('holocene_volcanoes', force_refresh=False)
                     self.csv_path = str(cache_path)
             else:
@@ -64,42 +147,90 @@ class GVP:
             self._volcanoes = None
             self._load_data()
 
+    def _close_records(self):
+        """Close the memory-mapped CSV file of lazily loaded data, if any."""
+        if isinstance(getattr(self, '_volcanoes', None), _LazyVolcanoes):
+            self._volcanoes.close()
+
+    def close(self):
+        """Release the open CSV file of lazily loaded data and the HTTP connections.
+
+        Volcanoes of lazily loaded data that have not been accessed yet can no
+        longer be read afterwards.
+        """
+        self._close_records()
+        self.downloader.close()
+
+    @staticmethod
+    def clear_parsed_cache():
+        """Forget the volcanoes parsed from local CSV files.
+
+        They are shared by GVP instances reading the same unchanged file, so
+        clearing frees their memory once those instances are gone and makes
+        the next GVP parse its file again.
+        """
+        _PARSED_CSV_CACHE.clear()
+
+    def __enter__(self) -> 'GVP':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _load_data(self):
         """Load volcano data from CSV file (for backward compatibility)."""
+        # Release the file of previously loaded lazy data before replacing it
+        self._close_records()
         volcanoes = []
 
         try:
-            with open(self.csv_path, 'r', encoding='utf-8-sig') as file:
-                reader = csv.DictReader(file)
-
-                # Check if we have the expected columns
-                if reader.fieldnames:
-                    print(f"CSV columns found: {reader.fieldnames}")
-
-                for i, row in enumerate(reader):
-                    try:
-                        # Clean up whitespace in all fields
-                        cleaned_row = {k.strip(): v.strip() if isinstance(v, str) else v
-                                       for k, v in row.items() if k is not None}
-                        volcanoes.append(Volcano(cleaned_row))
-                    except Exception as e:
-                        print(f"Error processing row {i + 1}: {e}")
-                        print(f"Row data: {row}")
-                        # Continue processing other rows
-                        continue
+            if self.lazy:
+                records = LazyCSVRecords(self.csv_path)
+                if records.header:
+                    logger.debug("CSV columns found: %s", records.header)
+                self._volcanoes = _LazyVolcanoes(records)
+                logger.info("Indexed %d volcanoes from %s", len(records), self.csv_path)
+                return
+
+            path = os.path.abspath(self.csv_path)
+            stat = os.stat(path)
+            cache_key = (path, stat.st_mtime_ns, stat.st_size, self.engine)
+            cached = _PARSED_CSV_CACHE.get(cache_key) if PARSED_CSV_CACHE_SIZE > 0 else None
+            if cached is not None:
+                _PARSED_CSV_CACHE.move_to_end(cache_key)
+                self._volcanoes = list(cached)
+                logger.info("Loaded %d volcanoes from %s (already parsed)", len(cached), self.csv_path)
+                return
+
+            header, records = read_csv_records(self.csv_path, workers=self.workers, engine=self.engine)
+
+            # Check if we have the expected columns
+            if header:
+                logger.debug("CSV columns found: %s", header)
+
+            for i, row in enumerate(records):
+                try:
+                    volcanoes.append(Volcano(row))
+                except Exception as e:
+                    logger.warning("Error processing row %d: %s (row data: %s)", i + 1, e, row)
+                    # Continue processing other rows
+                    continue
 
             self._volcanoes = volcanoes
-            print(f"Loaded {len(volcanoes)} volcanoes from {self.csv_path}")
+            logger.info("Loaded %d volcanoes from %s", len(volcanoes), self.csv_path)
+
+            if PARSED_CSV_CACHE_SIZE > 0:
+                _PARSED_CSV_CACHE[cache_key] = tuple(volcanoes)
+            while len(_PARSED_CSV_CACHE) > PARSED_CSV_CACHE_SIZE:
+                # Drop the least recently used file
+                _PARSED_CSV_CACHE.popitem(last=False)
 
         except FileNotFoundError:
-            print(f"CSV file not found: {self.csv_path}")
-            print("Please ensure the volcanoes.csv file is in the correct location.")
-            print(f"Current working directory: {os.getcwd()}")
-            print(f"Looking for file at: {os.path.abspath(self.csv_path)}")
+            logger.error("CSV file not found: %s (looking for file at: %s, current working directory: %s)",
+                         self.csv_path, os.path.abspath(self.csv_path), os.getcwd())
             self._volcanoes = []
         except Exception as e:
-            print(f"Error loading data: {e}")
-            print(f"File path: {self.csv_path}")
+            logger.error("Error loading data from %s: %s", self.csv_path, e)
             self._volcanoes = []
 
     def _load_volcanoes_from_csv(self, csv_path: str) -> List[Volcano]:
@@ -114,21 +245,16 @@ class GVP:
         volcanoes = []
         
         try:
-            with open(csv_path, 'r', encoding='utf-8-sig') as file:
-                reader = csv.DictReader(file)
-                
-                for i, row in enumerate(reader):
-                    try:
-                        # Clean up whitespace in all fields
-                        cleaned_row = {k.strip(): v.strip() if isinstance(v, str) else v
-                                       for k, v in row.items() if k is not None}
-                        volcanoes.append(Volcano(cleaned_row))
-                    except Exception as e:
-                        print(f"Error processing row {i + 1}: {e}")
-                        continue
-                        
+            _, records = read_csv_records(csv_path, workers=self.workers, engine=self.engine)
+            for i, row in enumerate(records):
+                try:
+                    volcanoes.append(Volcano(row))
+                except Exception as e:
+                    logger.warning("Error processing row %d: %s", i + 1, e)
+                    continue
+
         except Exception as e:
-            print(f"Error loading volcanoes from {csv_path}: {e}")
+            logger.error("Error loading volcanoes from %s: %s", csv_path, e)
             
         return volcanoes
 
@@ -141,26 +267,12 @@ class GVP:
         Returns:
             List of Eruption objects
         """
-        eruptions = []
-        
         try:
-            with open(csv_path, 'r', encoding='utf-8-sig') as file:
-                reader = csv.DictReader(file)
-                
-                for i, row in enumerate(reader):
-                    try:
-                        # Clean up whitespace in all fields
-                        cleaned_row = {k.strip(): v.strip() if isinstance(v, str) else v
-                                       for k, v in row.items() if k is not None}
-                        eruptions.append(Eruption(cleaned_row))
-                    except Exception as e:
-                        print(f"Error processing row {i + 1}: {e}")
-                        continue
-                        
+            # Bulk parse with numeric fields converted column by column
+            return EruptionSet.from_csv(csv_path, workers=self.workers, engine=self.engine).eruptions
         except Exception as e:
-            print(f"Error loading eruptions from {csv_path}: {e}")
-            
-        return eruptions
+            logger.error("Error loading eruptions from %s: %s", csv_path, e)
+            return []
 
     def _combine_volcanoes(self, holocene_volcanoes: List[Volcano], 
                           pleistocene_volcanoes: List[Volcano]) -> List[Volcano]:
@@ -176,32 +288,44 @@ class GVP:
         Returns:
             Combined list of volcanoes with duplicates removed
         """
-        combined = []
         holocene_numbers = {v.volcano_number for v in holocene_volcanoes if v.volcano_number is not None}
         
-        # Add all Holocene volcanoes
-        combined.extend(holocene_volcanoes)
-        
-        # Add Pleistocene volcanoes, checking for duplicates
-        duplicates = []
-        for pleist in pleistocene_volcanoes:
-            if pleist.volcano_number is not None:
-                if pleist.volcano_number in holocene_numbers:
-                    duplicates.append(pleist.volcano_number)
-                else:
-                    combined.append(pleist)
+        # All Holocene volcanoes, then the Pleistocene ones not already present
+        # (Pleistocene volcanoes without a number are skipped)
+        pleistocene_numbers = [v.volcano_number for v in pleistocene_volcanoes]
+        combined = holocene_volcanoes + [v for v, number in zip(pleistocene_volcanoes, pleistocene_numbers)
+                                         if number is not None and number not in holocene_numbers]
+        duplicates = [number for number in pleistocene_numbers if number in holocene_numbers]
         
         # Issue warning if duplicates found
         if duplicates:
             warnings.warn(
                 f"Found {len(duplicates)} duplicate volcano(s) in both Holocene and Pleistocene datasets "
-                f"(volcano numbers: {sorted(duplicates)[:10]}{'...' if len(duplicates) > 10 else ''}). "
+                f"(volcano numbers: {heapq.nsmallest(10, duplicates)}{'...' if len(duplicates) > 10 else ''}). "
                 f"Keeping Holocene records and discarding Pleistocene duplicates.",
                 UserWarning
             )
         
         return combined
 
+    def _fetch_datasets(self, datasets: List[str], load: Callable[[str], list]) -> List[list]:
+        """Download (or reuse the cached copy of) each dataset and load it with load.
+
+        With several datasets, each is downloaded and loaded in its own
+        thread, so one download overlaps the other and its parsing.
+
+        Returns:
+            The loaded data, in the order of datasets
+        """
+        def fetch(dataset):
+            csv_path = self.downloader.download(dataset, force_refresh=self.force_refresh)
+            return load(str(csv_path))
+
+        if len(datasets) <= 1:
+            return [fetch(dataset) for dataset in datasets]
+        with ThreadPoolExecutor(max_workers=len(datasets)) as executor:
+            return list(executor.map(fetch, datasets))
+
     def get_volcanoes(self, holocene: bool = True, pleistocene: bool = False) -> VolcanoSet:
         """Get volcanoes from GVP web services.
         
@@ -222,15 +346,16 @@ class GVP:
         holocene_volcs = []
         pleistocene_volcs = []
         
+        datasets = [ds for ds, wanted in (('holocene_volcanoes', holocene),
+                                          ('pleistocene_volcanoes', pleistocene)) if wanted]
+        loaded = self._fetch_datasets(datasets, self._load_volcanoes_from_csv)
         if holocene:
-            csv_path = self.downloader.download('holocene_volcanoes', force_refresh=self.force_refresh)
-            holocene_volcs = self._load_volcanoes_from_csv(str(csv_path))
-            print(f"Loaded {len(holocene_volcs)} Holocene volcanoes")
+            holocene_volcs = loaded.pop(0)
+            logger.info("Loaded %d Holocene volcanoes", len(holocene_volcs))
         
         if pleistocene:
-            csv_path = self.downloader.download('pleistocene_volcanoes', force_refresh=self.force_refresh)
-            pleistocene_volcs = self._load_volcanoes_from_csv(str(csv_path))
-            print(f"Loaded {len(pleistocene_volcs)} Pleistocene volcanoes")
+            pleistocene_volcs = loaded.pop(0)
+            logger.info("Loaded %d Pleistocene volcanoes", len(pleistocene_volcs))
         
         # Combine datasets if both are requested
         if holocene and pleistocene:
@@ -260,29 +385,56 @@ class GVP:
         
         all_eruptions = []
         
+        datasets = [ds for ds, wanted in (('holocene_eruptions', holocene),
+                                          ('pleistocene_eruptions', pleistocene)) if wanted]
+        loaded = self._fetch_datasets(datasets, self._load_eruptions_from_csv)
         if holocene:
-            csv_path = self.downloader.download('holocene_eruptions', force_refresh=self.force_refresh)
-            holocene_eruptions = self._load_eruptions_from_csv(str(csv_path))
+            holocene_eruptions = loaded.pop(0)
             all_eruptions.extend(holocene_eruptions)
-            print(f"Loaded {len(holocene_eruptions)} Holocene eruptions")
+            logger.info("Loaded %d Holocene eruptions", len(holocene_eruptions))
         
         if pleistocene:
-            csv_path = self.downloader.download('pleistocene_eruptions', force_refresh=self.force_refresh)
-            pleistocene_eruptions = self._load_eruptions_from_csv(str(csv_path))
+            pleistocene_eruptions = loaded.pop(0)
             all_eruptions.extend(pleistocene_eruptions)
-            print(f"Loaded {len(pleistocene_eruptions)} Pleistocene eruptions")
+            logger.info("Loaded %d Pleistocene eruptions", len(pleistocene_eruptions))
         
         return EruptionSet(all_eruptions)
 
     @property
-    def volcanoes(self) -> List[Volcano]:
-        """Get all volcanoes (for backward compatibility)."""
-        if self.use_web_services:
+    def volcanoes(self) -> Sequence[Volcano]:
+        """Get a copy of all volcanoes (for backward compatibility).
+
+        Changing the returned list does not change the loaded data. With
+        lazy=True this is a read-only sequence instead of a list (no copy(),
+        append() or +; use list(gvp.volcanoes) for one) that creates each
+        Volcano on first access.
+        """
+        volcanoes = self._loaded_volcanoes()
+        if isinstance(volcanoes, _LazyVolcanoes):
+            return volcanoes
+        return list(volcanoes)
+
+    def _loaded_volcanoes(self):
+        """Get the loaded volcanoes themselves, without copying them."""
+        if self._volcanoes is None:
             # If using web services but data hasn't been loaded yet, return empty
             # User should call get_volcanoes() instead
-            if self._volcanoes is None:
-                return []
-        return self._volcanoes if self._volcanoes else []
+            return _NO_VOLCANOES
+        return self._volcanoes
+
+    def _volcano_set(self) -> VolcanoSet:
+        """Get a VolcanoSet over all volcanoes, reused while the data is unchanged.
+
+        Its column arrays and indexes are built on first use and shared by
+        every filter_volcanoes() call.
+        """
+        volcanoes = self._loaded_volcanoes()
+        if self._all_volcanoes is None or self._all_volcanoes._volcanoes is not volcanoes:
+            self._all_volcanoes = VolcanoSet(volcanoes)
+            # Derived lookups are rebuilt lazily for the new data
+            self._countries = None
+            self._volcano_types = None
+        return self._all_volcanoes
 
     def filter_volcanoes(self,
                          country: Optional[str] = None,
@@ -311,73 +463,80 @@ class GVP:
         Returns:
             VolcanoSet containing matching volcanoes
         """
-        filtered = self.volcanoes.copy()
-
-        # Filter by country
-        if country:
-            filtered = [v for v in filtered if country.lower() in v.country.lower()]
-
-        # Filter by name
-        if name:
-            filtered = [v for v in filtered if name.lower() in v.name.lower()]
-
-        # Filter by ID
-        if id is not None:
-            filtered = [v for v in filtered if v.id == id]
-
-        # Filter by volcano type
-        if volcano_type:
-            filtered = [v for v in filtered if volcano_type.lower() in v.volcano_type.lower()]
-
-        # Filter by geologic epoch
-        if geologic_epoch:
-            filtered = [v for v in filtered if geologic_epoch.lower() in v.geologic_epoch.lower()]
-
-        # Filter by elevation range
-        if min_elevation is not None or max_elevation is not None:
-            new_filtered = []
-            for v in filtered:
-                elev = v.get_elevation()
-                if elev is not None:
-                    if min_elevation is not None and elev < min_elevation:
-                        continue
-                    if max_elevation is not None and elev > max_elevation:
-                        continue
-                    new_filtered.append(v)
-            filtered = new_filtered
-
-        # Create VolcanoSet
-        volcano_set = VolcanoSet(filtered)
+        all_volcanoes = self._volcano_set()
+        # Repeated queries (e.g. in a loop over stations) reuse the memoized result
+        key = ('filter_volcanoes', _lower_or_none(country), _lower_or_none(name), id,
+               _lower_or_none(volcano_type), _lower_or_none(geologic_epoch),
+               latitude, longitude, radius_km, min_elevation, max_elevation)
+        return all_volcanoes._cached(key, lambda: self._filter_volcanoes(
+            all_volcanoes, country, name, id, volcano_type, geologic_epoch,
+            latitude, longitude, radius_km, min_elevation, max_elevation))
+
+    def _filter_volcanoes(self, all_volcanoes: VolcanoSet,
+                          country, name, id, volcano_type, geologic_epoch,
+                          latitude, longitude, radius_km, min_elevation, max_elevation) -> VolcanoSet:
+        # All predicates are evaluated as boolean masks over the column arrays
+        # and indexes of the full set, then the matches are gathered once
+        mask = all_volcanoes._filter_mask(country=country, name=name, id=id,
+                                          volcano_type=volcano_type, geologic_epoch=geologic_epoch,
+                                          min_elevation=min_elevation, max_elevation=max_elevation)
+        by_distance = latitude is not None and longitude is not None
+        if mask.all():
+            # Nothing filtered out: query the full set itself, which keeps its
+            # column arrays and distance caches. Callers get a fresh view of
+            # the memoized result, so they cannot change it.
+            volcano_set = all_volcanoes
+        else:
+            if by_distance:
+                # Compute the coordinate columns once on the full set; the
+                # subset inherits them instead of rebuilding them per call
+                all_volcanoes._radian_arrays()
+            volcano_set = all_volcanoes._take(np.flatnonzero(mask))
 
         # Apply distance-based filtering and sorting
-        if latitude is not None and longitude is not None:
+        if by_distance:
             if radius_km is not None:
-                volcano_set = volcano_set.within_radius(latitude, longitude, radius_km)
-            volcano_set = volcano_set.sort_by_distance(latitude, longitude)
+                volcano_set = volcano_set.within_radius(latitude, longitude, radius_km, sort=True)
+            else:
+                volcano_set = volcano_set.sort_by_distance(latitude, longitude)
 
         return volcano_set
 
     def get_volcano_by_id(self, volcano_id: int) -> Optional[Volcano]:
         """Get a single volcano by its ID."""
-        result = self.filter_volcanoes(id=volcano_id)
-        return result[0] if len(result) > 0 else None
+        all_volcanoes = self._volcano_set()
+        indices = all_volcanoes._id_index().get(volcano_id)
+        # First occurrence wins, as with a filter
+        return all_volcanoes[int(indices[0])] if indices is not None else None
+
+    def _sorted_countries(self) -> Tuple[str, ...]:
+        """Get the sorted countries, computed once per loaded dataset."""
+        all_volcanoes = self._volcano_set()
+        if self._countries is None:
+            self._countries = tuple(sorted(all_volcanoes.counts_by_country()))
+        return self._countries
+
+    def _sorted_volcano_types(self) -> Tuple[str, ...]:
+        """Get the sorted volcano types, computed once per loaded dataset."""
+        all_volcanoes = self._volcano_set()
+        if self._volcano_types is None:
+            self._volcano_types = tuple(sorted(all_volcanoes.counts_by_type()))
+        return self._volcano_types
 
     def get_countries(self) -> List[str]:
         """Get a list of all countries with volcanoes."""
-        countries = list(set(v.country for v in self.volcanoes if v.country))
-        return sorted(countries)
+        return list(self._sorted_countries())
 
     def get_volcano_types(self) -> List[str]:
         """Get a list of all volcano types."""
-        types = list(set(v.volcano_type for v in self.volcanoes if v.volcano_type))
-        return sorted(types)
+        return list(self._sorted_volcano_types())
 
     def stats(self) -> Dict[str, Any]:
         """Get database statistics."""
         stats = {
-            'total_volcanoes': len(self.volcanoes),
-            'countries': len(self.get_countries()),
-            'volcano_types': len(self.get_volcano_types()),
+            'total_volcanoes': len(self._loaded_volcanoes()),
+            'countries': len(self._sorted_countries()),
+            'volcano_types': len(self._sorted_volcano_types()),
         }
         
         if hasattr(self, 'csv_path') and self.csv_path:
@@ -401,19 +560,16 @@ class GVP:
         Returns:
             Path to the exported file
         """
+        volcanoes = self._loaded_volcanoes()
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            if not self.volcanoes:
+            if not volcanoes:
                 return output_path
             
             # Get fieldnames from first volcano
-            fieldnames = list(self.volcanoes[0]._data.keys())
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for volcano in self.volcanoes:
-                writer.writerow(volcano._data)
+            fieldnames = list(volcanoes[0]._data.keys())
+            write_dict_rows(f, fieldnames, [volcano._data for volcano in volcanoes])
         
-        print(f"Exported {len(self.volcanoes)} volcanoes to {output_path}")
+        logger.info("Exported %d volcanoes to %s", len(volcanoes), output_path)
         return output_path
     
     def export_to_geojson(self, output_path: str) -> str:
@@ -425,32 +581,19 @@ class GVP:
         Returns:
             Path to the exported file
         """
-        import json
-        
-        features = []
-        for volcano in self.volcanoes:
-            if volcano.lat is None or volcano.lon is None:
-                continue
-            
-            feature = {
-                'type': 'Feature',
-                'geometry': {
-                    'type': 'Point',
-                    'coordinates': [volcano.lon, volcano.lat]
-                },
-                'properties': volcano._data.copy()
-            }
-            features.append(feature)
-        
-        geojson = {
-            'type': 'FeatureCollection',
-            'features': features
-        }
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(geojson, f, indent=2, ensure_ascii=False)
-        
-        print(f"Exported {len(features)} volcanoes to GeoJSON: {output_path}")
+        # Features are generated and written one at a time; the encoder only
+        # reads the data dicts, so they are not copied
+        features = ({
+            'type': 'Feature',
+            'geometry': {
+                'type': 'Point',
+                'coordinates': [volcano.lon, volcano.lat]
+            },
+            'properties': volcano._data
+        } for volcano in self._loaded_volcanoes() if volcano.lat is not None and volcano.lon is not None)
+        count = write_feature_collection(features, output_path)
+        
+        logger.info("Exported %d volcanoes to GeoJSON: %s", count, output_path)
         return output_path
     
     def get_cache_info(self) -> Optional[Dict[str, Any]]:
@@ -6,12 +6,98 @@ and exporting to various formats (CSV, GeoJSON).
 """
 import os
 import csv
+import logging
+import re
+import shutil
+import sys
 import json
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import Optional, Dict, List, Any
-from urllib.parse import urlparse
+from typing import Optional, Dict, List, Any, Tuple
+from urllib.parse import urlencode, urlparse
+
+from ..utils.csv_reader import HAS_PYARROW
+from ..utils.geojson import write_feature_collection
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # bytes read from the network at a time
+
+# Unescaped '<' in the GVP data that breaks XML parsers; a compiled pattern
+# scans a chunk about twice as fast as bytes.replace when there is no match
+_OPEN_LT_RE = re.compile(rb'\(< ')
+
+_FICLONE = 0x40049409  # Linux ioctl cloning a file (fcntl.FICLONE from Python 3.12)
+
+
+def _convert_property(value):
+    """Convert a CSV value to a float (if it has a '.') or int, else keep it as is."""
+    # int() and float() only accept text starting with a digit, sign, point or
+    # whitespace; skip the attempt (and its exception) for everything else
+    if not value:
+        return value
+    first = value[0]
+    if not (first.isdigit() or first in '+-.' or first.isspace()):
+        return value
+    try:
+        if '.' in value:
+            return float(value)
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _build_download_urls(base_url: str, datasets: Dict[str, str]) -> Dict[Tuple[str, str], str]:
+    """Build the WFS GetFeature URL of every dataset in CSV and GeoJSON format."""
+    urls = {}
+    for dataset, type_name in datasets.items():
+        for output_format in ('csv', 'geojson'):
+            params = {
+                'service': 'WFS',
+                'version': '1.0.0',
+                'request': 'GetFeature',
+                'typeName': type_name,
+                'outputFormat': output_format,
+            }
+            # urlencode percent-escapes the values (e.g. the ':' in the type names)
+            urls[dataset, output_format] = f"{base_url}?{urlencode(params)}"
+    return urls
+
+
+def _link_file(src: Path, dst: Path) -> bool:
+    """Hard-link src to dst, replacing dst. Return False if that is not possible."""
+    tmp_path = dst.with_name(dst.name + '.part')
+    try:
+        os.link(src, tmp_path)
+        os.replace(tmp_path, dst)
+        return True
+    except OSError:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        return False
+
+
+def _clone_file(src: Path, dst: Path) -> bool:
+    """Copy src to dst as a copy-on-write clone (Linux, e.g. btrfs or XFS).
+
+    No data is copied; the file metadata is copied like shutil.copy2 does.
+    Return False if the filesystem or platform does not support it.
+    """
+    if not sys.platform.startswith('linux'):
+        return False
+    import fcntl
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        return False
+    shutil.copystat(src, dst)
+    return True
 
 
 class GVPDownloader:
@@ -28,12 +114,23 @@ class GVPDownloader:
         'pleistocene_eruptions': 'GVP-VOTW:Smithsonian_VOTW_Pleistocene_Eruptions',
     }
     
-    def __init__(self, cache_dir: Optional[str] = None, timeout: int = 60):
+    # Download URL of each (dataset, format), built once
+    _URLS = _build_download_urls(BASE_URL, DATASETS)
+    
+    # Seconds a get_cache_info result is reused for, so repeated calls (e.g.
+    # from GVP.stats) don't stat and read the cache files every time
+    CACHE_INFO_TTL = 30
+    
+    def __init__(self, cache_dir: Optional[str] = None, timeout: int = 60,
+                 max_age: Optional[float] = None):
         """Initialize the GVP downloader.
         
         Args:
             cache_dir: Directory to store cached files. If None, uses a default cache directory.
             timeout: Request timeout in seconds.
+            max_age: If set, cached data older than this many seconds is revalidated
+                with the server on download (a conditional request, so unchanged
+                data is not transferred again). If None, cached data is used as is.
         """
         if cache_dir is None:
             # Use a cache directory in the current working directory (project directory)
@@ -42,13 +139,28 @@ class GVPDownloader:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.timeout = timeout
+        self.max_age = max_age
+        # One session for all downloads: the datasets share a host, so the
+        # pooled connection (and its TLS handshake) is reused between them.
+        # Transient gateway errors are retried with backoff.
+        self._session = requests.Session()
+        retry_options = dict(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        try:
+            retries = Retry(allowed_methods=['GET'], **retry_options)
+        except TypeError:
+            # urllib3 < 1.26 (still allowed by requests>=2.25) calls it method_whitelist
+            retries = Retry(method_whitelist=['GET'], **retry_options)
+        self._session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                                    max_retries=retries))
+        # dataset (or None for all) -> (time.monotonic() of the lookup, info)
+        self._cache_info: Dict[Optional[str], Tuple[float, Dict[str, Any]]] = {}
         
     def _get_cache_path(self, dataset: str, format: str = 'csv') -> Path:
         """Get the cache file path for a dataset.
         
         Args:
             dataset: Dataset name (e.g., 'holocene_volcanoes')
-            format: File format ('csv' or 'geojson')
+            format: File format ('csv', 'geojson' or 'parquet')
             
         Returns:
             Path to the cache file
@@ -79,53 +191,86 @@ class GVPDownloader:
         if dataset not in self.DATASETS:
             raise ValueError(f"Unknown dataset: {dataset}. Available: {list(self.DATASETS.keys())}")
         
-        type_name = self.DATASETS[dataset]
-        
-        # Build WFS request URL
-        params = {
-            'service': 'WFS',
-            'version': '1.0.0',
-            'request': 'GetFeature',
-            'typeName': type_name,
-            'outputFormat': output_format if output_format == 'geojson' else 'csv'
-        }
-        
-        # Build query string
-        query_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-        url = f"{self.BASE_URL}?{query_string}"
-        
-        return url
+        return self._URLS[dataset, 'geojson' if output_format == 'geojson' else 'csv']
     
-    def _download_data(self, url: str) -> bytes:
-        """Download data from a URL.
+    def _download_data(self, url: str, output_path: Path,
+                       validators: Optional[Dict[str, str]] = None) -> Optional[Tuple[int, Dict[str, str]]]:
+        """Download data from a URL to a file, streaming it in chunks.
+        
+        The data is written to a temporary file next to output_path, which
+        replaces output_path once the download is complete, so a failed
+        download never leaves a truncated file behind.
         
         Args:
             url: URL to download from
+            output_path: File to save the data to
+            validators: 'etag' and/or 'last_modified' of the copy in output_path.
+                If given, the request is conditional and the body is only sent
+                if the data changed.
             
         Returns:
-            Downloaded data as bytes
+            (number of bytes written, validators of the new data), or None if
+            the server reports the data has not changed
         """
+        headers = {}
+        if validators:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+        
+        tmp_path = output_path.with_name(output_path.name + '.part')
+        size = 0
         try:
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            # Handle XML syntax issue: replace "(< " with "(&lt; "
-            # This fixes a known issue with GVP web services
-            content = response.content
-            if b'(< ' in content:
-                content = content.replace(b'(< ', b'(&lt; ')
+            with self._session.get(url, stream=True, timeout=self.timeout, headers=headers) as response:
+                if response.status_code == 304 and headers:
+                    return None
+                response.raise_for_status()
+                new_validators = {key: response.headers[header]
+                                  for key, header in (('etag', 'ETag'), ('last_modified', 'Last-Modified'))
+                                  if header in response.headers}
+                
+                with open(tmp_path, 'wb') as f:
+                    # Handle XML syntax issue: replace "(< " with "(&lt; "
+                    # This fixes a known issue with GVP web services. The last
+                    # two bytes of each chunk are held back, so a match split
+                    # across two chunks is still replaced.
+                    carry = b''
+                    for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                        data = _OPEN_LT_RE.sub(b'(&lt; ', carry + chunk)
+                        carry = data[-2:]
+                        f.write(data[:-2])
+                        size += len(data) - len(carry)
+                    f.write(carry)
+                    size += len(carry)
             
-            return content
+            os.replace(tmp_path, output_path)
+            return size, new_validators
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Failed to download data from {url}: {e}")
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
     
-    def _save_metadata(self, dataset: str, download_time: datetime, file_path: Path):
+    def close(self):
+        """Close the HTTP connections kept open between downloads."""
+        self._session.close()
+    
+    def __enter__(self) -> 'GVPDownloader':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _save_metadata(self, dataset: str, download_time: datetime, file_path: Path,
+                       validators: Optional[Dict[str, str]] = None):
         """Save metadata about a cached file.
         
         Args:
             dataset: Dataset name
-            download_time: When the data was downloaded
+            download_time: When the data was downloaded (or last found unchanged)
             file_path: Path to the cached file
+            validators: HTTP 'etag' and 'last_modified' of the data, if known
         """
         metadata = {
             'dataset': dataset,
@@ -134,10 +279,13 @@ class GVPDownloader:
             'file_path': str(file_path),
             'file_size': file_path.stat().st_size if file_path.exists() else 0,
         }
+        if validators:
+            metadata.update(validators)
         
         metadata_path = self._get_metadata_path(dataset)
         with open(metadata_path, 'w') as f:
             json.dump(metadata, f, indent=2)
+        self._cache_info.clear()
     
     def _load_metadata(self, dataset: str) -> Optional[Dict[str, Any]]:
         """Load metadata for a cached dataset.
@@ -172,48 +320,135 @@ class GVPDownloader:
             raise ValueError(f"Unknown dataset: {dataset}. Available: {list(self.DATASETS.keys())}")
         
         cache_path = self._get_cache_path(dataset, 'csv')
+        metadata = self._load_metadata(dataset) if cache_path.exists() else None
         
         # Check if we have cached data and if we should use it
-        if not force_refresh and cache_path.exists():
-            metadata = self._load_metadata(dataset)
-            if metadata:
-                print(f"Using cached data for {dataset} (downloaded: {metadata['download_time']})")
+        if not force_refresh and metadata:
+            expired = (self.max_age is not None
+                       and time.time() - metadata.get('download_timestamp', 0) > self.max_age)
+            if not expired:
+                logger.info("Using cached data for %s (downloaded: %s)", dataset, metadata['download_time'])
                 return cache_path
         
-        # Download fresh data
-        print(f"Downloading {dataset} from GVP web services...")
+        # Download fresh data; if the cached copy has validators, only if it changed
+        validators = {key: metadata[key] for key in ('etag', 'last_modified') if key in metadata} if metadata else {}
+        logger.info("Downloading %s from GVP web services...", dataset)
         url = self._get_download_url(dataset, 'csv')
-        data = self._download_data(url)
+        # Streamed straight into the cache
+        result = self._download_data(url, cache_path, validators)
         
-        # Save to cache
-        cache_path.write_bytes(data)
+        download_time = datetime.now()
+        if result is None:
+            # Not modified: keep the cached file, just record that it was checked
+            self._save_metadata(dataset, download_time, cache_path, validators)
+            logger.info("Cached %s is up to date", dataset)
+            return cache_path
+        size, validators = result
         
         # Save metadata
-        download_time = datetime.now()
-        self._save_metadata(dataset, download_time, cache_path)
+        self._save_metadata(dataset, download_time, cache_path, validators)
         
-        print(f"Downloaded and cached {dataset} ({len(data)} bytes)")
+        logger.info("Downloaded and cached %s (%d bytes)", dataset, size)
         return cache_path
     
+    def load_table(self, dataset: str, columns: Optional[List[str]] = None,
+                   force_refresh: bool = False):
+        """Load a dataset as a pyarrow Table (requires pyarrow).
+        
+        The downloaded CSV is parsed once and saved as a Parquet file next to
+        it. Later calls read the Parquet file instead, and only the requested
+        columns, until the CSV is downloaded again.
+        
+        Args:
+            dataset: Dataset name
+            columns: Names of the columns to load, or None for all columns
+            force_refresh: If True, download fresh data even if cached
+            
+        Returns:
+            pyarrow.Table with the dataset
+        """
+        if not HAS_PYARROW:
+            raise ImportError("pyarrow is required for load_table. Install with: pip install pyarrow")
+        import pyarrow.parquet as pq
+        from pyarrow import csv as pacsv
+        
+        csv_path = self.download(dataset, force_refresh=force_refresh)
+        parquet_path = self._get_cache_path(dataset, 'parquet')
+        if parquet_path.exists() and parquet_path.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns:
+            return pq.read_table(parquet_path, columns=columns)
+        
+        table = pacsv.read_csv(csv_path)
+        # Written under a temporary name first, so a partly written file is never read
+        tmp_path = parquet_path.with_name(parquet_path.name + '.part')
+        pq.write_table(table, tmp_path, compression='zstd')
+        os.replace(tmp_path, parquet_path)
+        return table.select(columns) if columns is not None else table
+    
+    def download_many(self, datasets: Optional[List[str]] = None, force_refresh: bool = False,
+                      max_workers: int = 4) -> Dict[str, Path]:
+        """Download several datasets from GVP web services concurrently.
+        
+        Each dataset is downloaded in its own thread (up to max_workers at a
+        time), sharing the downloader's connection pool.
+        
+        Args:
+            datasets: Dataset names, or None for all datasets
+            force_refresh: If True, download even if cached data exists
+            max_workers: Maximum number of simultaneous downloads
+            
+        Returns:
+            Dictionary mapping each dataset name to its downloaded/cached CSV file
+        """
+        if datasets is None:
+            datasets = list(self.DATASETS.keys())
+        else:
+            # Download each dataset once: concurrent downloads of the same one
+            # would share (and race on) its temporary file
+            datasets = list(dict.fromkeys(datasets))
+        for dataset in datasets:
+            if dataset not in self.DATASETS:
+                raise ValueError(f"Unknown dataset: {dataset}. Available: {list(self.DATASETS.keys())}")
+        
+        paths = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(datasets)))) as executor:
+            futures = {executor.submit(self.download, ds, force_refresh): ds for ds in datasets}
+            for done, future in enumerate(as_completed(futures), 1):
+                paths[futures[future]] = future.result()
+                logger.info("[%d/%d] %s ready", done, len(futures), futures[future])
+        
+        # In the order the datasets were given
+        return {ds: paths[ds] for ds in datasets}
+    
     def export_to_csv(self, dataset: str, output_path: Optional[str] = None, 
-                     force_refresh: bool = False) -> Path:
+                     force_refresh: bool = False, mode: str = 'copy') -> Path:
         """Download and export a dataset to CSV.
         
         Args:
             dataset: Dataset name
             output_path: Output file path. If None, uses cache path.
             force_refresh: If True, download fresh data even if cached
+            mode: How the cached file is exported to output_path: 'copy' (default)
+                makes an independent copy, cloned without copying data where the
+                filesystem supports it (e.g. btrfs, XFS). 'link' hard-links the
+                cached file instead, so changes to the export also change the
+                cache; it falls back to a copy across filesystems.
             
         Returns:
             Path to the exported CSV file
         """
+        if mode not in ('copy', 'link'):
+            raise ValueError(f"Unknown export mode: {mode!r} (expected 'copy' or 'link')")
         cache_path = self.download(dataset, force_refresh=force_refresh)
         
         if output_path:
             output_path = Path(output_path)
+            if output_path.exists() and output_path.samefile(cache_path):
+                # Already the cached file, e.g. linked by an earlier export
+                return output_path
             # Copy cached file to output path
-            import shutil
-            shutil.copy2(cache_path, output_path)
+            if not (mode == 'link' and _link_file(cache_path, output_path)):
+                if not _clone_file(cache_path, output_path):
+                    shutil.copy2(cache_path, output_path)
             return output_path
         
         return cache_path
@@ -250,55 +485,62 @@ class GVPDownloader:
             csv_path: Path to input CSV file
             geojson_path: Path to output GeoJSON file
         """
-        features = []
+        # Features are generated while the CSV is read and written one at a time
+        count = write_feature_collection(self._csv_features(csv_path), geojson_path)
         
+        logger.info("Exported %d features to GeoJSON: %s", count, geojson_path)
+    
+    def _csv_features(self, csv_path: Path):
+        """Generate a GeoJSON feature for each CSV row with valid coordinates."""
         with open(csv_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
+            # Plain csv.reader with column positions worked out once from the
+            # header, so no dict is built per row just to read it back
+            reader = csv.reader(f)
+            fieldnames = next(reader, [])
+            positions = {name: i for i, name in enumerate(fieldnames)}  # last one wins, as with DictReader
+            lat_index = positions.get('Latitude', positions.get('latitude'))
+            lon_index = positions.get('Longitude', positions.get('longitude'))
+            # All other fields become properties
+            property_columns = [(key, i) for i, key in enumerate(fieldnames)
+                                if key.lower() not in ('latitude', 'longitude', 'lat', 'lon')]
+            n_fields = len(fieldnames)
+            # Raw value -> converted value; most values (countries, types,
+            # years, empty cells) repeat, so each is converted only once
+            converted = {}
             
             for row in reader:
+                if not row:
+                    continue
+                if len(row) < n_fields:
+                    # Missing trailing cells, as DictReader fills them in
+                    row = row + [None] * (n_fields - len(row))
+                
                 # Extract coordinates
                 try:
-                    lat = float(row.get('Latitude', row.get('latitude', 0)))
-                    lon = float(row.get('Longitude', row.get('longitude', 0)))
-                except (ValueError, KeyError):
+                    lat = float(row[lat_index]) if lat_index is not None else 0.0
+                    lon = float(row[lon_index]) if lon_index is not None else 0.0
+                except (ValueError, TypeError):
                     # Skip rows without valid coordinates
                     continue
                 
+                # Add all other fields as properties
+                properties = {}
+                for key, i in property_columns:
+                    value = row[i]
+                    try:
+                        properties[key] = converted[value]
+                    except KeyError:
+                        properties[key] = converted[value] = _convert_property(value)
+                
                 # Create GeoJSON feature
-                feature = {
+                yield {
                     'type': 'Feature',
                     'geometry': {
                         'type': 'Point',
                         'coordinates': [lon, lat]
                     },
-                    'properties': {}
+                    'properties': properties
                 }
-                
-                # Add all other fields as properties
-                for key, value in row.items():
-                    if key.lower() not in ['latitude', 'longitude', 'lat', 'lon']:
-                        # Try to convert numeric values
-                        try:
-                            if '.' in str(value):
-                                feature['properties'][key] = float(value)
-                            else:
-                                feature['properties'][key] = int(value)
-                        except (ValueError, TypeError):
-                            feature['properties'][key] = value
-                
-                features.append(feature)
-        
-        # Create GeoJSON FeatureCollection
-        geojson = {
-            'type': 'FeatureCollection',
-            'features': features
-        }
-        
-        # Write to file
-        with open(geojson_path, 'w', encoding='utf-8') as f:
-            json.dump(geojson, f, indent=2, ensure_ascii=False)
-        
-        print(f"Exported {len(features)} features to GeoJSON: {geojson_path}")
     
     def get_cache_info(self, dataset: Optional[str] = None) -> Dict[str, Any]:
         """Get information about cached datasets.
@@ -309,6 +551,12 @@ class GVPDownloader:
         Returns:
             Dictionary with cache information
         """
+        now = time.monotonic()
+        cached = self._cache_info.get(dataset)
+        if cached is not None and now - cached[0] < self.CACHE_INFO_TTL:
+            # Copies, so callers can't modify the remembered result
+            return {ds: dict(ds_info) for ds, ds_info in cached[1].items()}
+        
         if dataset:
             datasets = [dataset]
         else:
@@ -332,7 +580,8 @@ class GVPDownloader:
                     'file_path': str(cache_path),
                 }
         
-        return info
+        self._cache_info[dataset] = (now, info)
+        return {ds: dict(ds_info) for ds, ds_info in info.items()}
     
     def clear_cache(self, dataset: Optional[str] = None):
         """Clear cached data.
@@ -340,6 +589,7 @@ class GVPDownloader:
         Args:
             dataset: Specific dataset to clear, or None to clear all
         """
+        self._cache_info.clear()
         if dataset:
             datasets = [dataset]
         else:
@@ -347,11 +597,15 @@ class GVPDownloader:
         
         for ds in datasets:
             cache_path = self._get_cache_path(ds, 'csv')
+            parquet_path = self._get_cache_path(ds, 'parquet')
             metadata_path = self._get_metadata_path(ds)
             
             if cache_path.exists():
                 cache_path.unlink()
-                print(f"Removed cache for {ds}")
+                logger.info("Removed cache for %s", ds)
+            
+            if parquet_path.exists():
+                parquet_path.unlink()
             
             if metadata_path.exists():
                 metadata_path.unlink()
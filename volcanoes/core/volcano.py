@@ -1,10 +1,28 @@
-import math
+import sys
+import textwrap
 from typing import Optional, Tuple, Dict, Any
 
+import numpy as np
+
+from ..utils.distance import haversine_distance, haversine_distance_vec
+from ..utils.plotting import get_tiler, get_zoom_level_interpolated
+
+M_TO_FT = 3.28084  # feet per meter
+
+# Reused by Volcano.print for the geological summary
+_SUMMARY_WRAPPER = textwrap.TextWrapper(width=80)
+
+# Fields with few distinct values; interned so all volcanoes share one string per value
+CATEGORICAL_FIELDS = ('Country', 'Primary_Volcano_Type', 'Region', 'Subregion', 'Tectonic_Setting',
+                      'Geologic_Epoch', 'Evidence_Category', 'Major_Rock_Type')
+
 
 class Volcano:
     """Represents a single volcano with all its properties and methods."""
 
+    # No per-instance __dict__: a full dataset holds thousands of volcanoes
+    __slots__ = ('_data',)
+
     def __init__(self, data: Dict[str, Any]):
         """Initialize a Volcano object from a dictionary of data."""
         self._data = data
@@ -16,10 +34,17 @@ class Volcano:
         if self._data.get('Volcano_Name', '').strip().lower() == 'unnamed':
             self._data['Volcano_Name'] = f"Unnamed-{self._data['Volcano_Number']}"
 
-        # Convert numeric fields
+        for field in CATEGORICAL_FIELDS:
+            value = self._data.get(field)
+            if isinstance(value, str):
+                self._data[field] = sys.intern(value)
+
+        # Convert numeric fields; missing values become None
         numeric_fields = ['Volcano_Number', 'Last_Eruption_Year', 'Latitude', 'Longitude', 'Elevation']
         for field in numeric_fields:
-            if field in self._data and self._data[field] != '':
+            if self._data.get(field) == '':
+                self._data[field] = None
+            elif field in self._data:
                 try:
                     if field == 'Volcano_Number':
                         self._data[field] = int(self._data[field])
@@ -89,27 +114,32 @@ class Volcano:
         if elev_m is None:
             return None
 
-        if units.lower() == "m":
+        if units == "m":
+            # Common case, without lowercasing
+            return elev_m
+        units = units.lower()
+        if units == "m":
             return elev_m
-        elif units.lower() in ["ft", "feet"]:
-            return elev_m * 3.28084
+        elif units in ["ft", "feet"]:
+            return elev_m * M_TO_FT
         else:
             raise ValueError("Units must be 'm' or 'ft'")
 
     @property
     def elevation(self) -> Optional[float]:
         "Get the elevation in m."
-        return self.get_elevation()
+        return self._data.get('Elevation')
 
     @property
     def elev(self) -> Optional[float]:
         """Alias for elevation."""
-        return self.elevation
+        return self._data.get('Elevation')
 
     @property
     def origin(self) -> Tuple[Optional[float], Optional[float], Optional[float]]:
         """Get (latitude, longitude, elevation_m) as a tuple."""
-        return (self.lat, self.lon, self.get_elevation())
+        data = self._data
+        return (data.get('Latitude'), data.get('Longitude'), data.get('Elevation'))
 
     @property
     def last_eruption_year(self) -> Optional[float]:
@@ -157,8 +187,17 @@ class Volcano:
         # This will be implemented when you add the EruptionHistory class
         return None
 
-    def distance_to(self, lat: float, lon: float) -> float:
-        """Calculate distance to a point in kilometers using Haversine formula."""
+    def distance_to(self, lat, lon):
+        """Calculate distance to a point in kilometers using Haversine formula.
+
+        lat and lon may also be arrays of points, in which case an array of
+        distances is returned, computed in one vectorized pass.
+        """
+        if np.ndim(lat) or np.ndim(lon):
+            if self.lat is None or self.lon is None:
+                return np.full(np.broadcast(lat, lon).shape, np.inf)
+            return haversine_distance_vec(self.lat, self.lon, lat, lon)
+
         if self.lat is None or self.lon is None:
             return float('inf')
 
@@ -166,24 +205,12 @@ class Volcano:
 
     def _haversine_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """Calculate the great circle distance between two points using Haversine formula."""
-        R = 6371  # Earth's radius in kilometers
-
-        # Convert to radians
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-
-        # Haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-        c = 2 * math.asin(math.sqrt(a))
-
-        return R * c
+        return haversine_distance(lat1, lon1, lat2, lon2)
 
     def simple_plot(self):
         """Plot the volcano on a simple map."""
         try:
             import matplotlib.pyplot as plt
-            import matplotlib.patches as patches
         except ImportError:
             print("Matplotlib is required for plotting. Install with: pip install matplotlib")
             return
@@ -228,17 +255,12 @@ class Volcano:
 
         try:
             import matplotlib.pyplot as plt
-            import matplotlib.patches as patches
             import cartopy.crs as ccrs
-            from cartopy.io.img_tiles import GoogleTiles
         except ImportError:
             print("Matplotlib and Cartopy are required for advanced plotting. Install with: pip install matplotlib")
             self.simple_plot()
             return
 
-        import numpy as np
-        from volcanoes.utils.plotting import get_zoom_level_interpolated
-
         if self.lat is None or self.lon is None:
             print(f"Cannot plot {self.name}: missing coordinates")
             return
@@ -249,8 +271,7 @@ class Volcano:
         extent_deg = extent_km / (111.32 * np.cos(lat_rad))
         zoom_level = get_zoom_level_interpolated(extent_km)
 
-        tiler = GoogleTiles(style="satellite")
-        # tiler = GoogleTiles(style="terrain")  # "street" works, "terrain" appears not to work
+        tiler = get_tiler()
         mercator = tiler.crs
 
         fig = plt.figure()
@@ -279,7 +300,8 @@ class Volcano:
 
     def __str__(self) -> str:
         """String representation of the volcano."""
-        elev_str = f"{self.get_elevation() :.0f}m" if self.get_elevation() else "Unknown"
+        elev = self.elevation
+        elev_str = f"{elev :.0f}m" if elev else "Unknown"
         return f"Volcano ({self.name}, {self.country}, {elev_str})"
 
     def __repr__(self) -> str:
@@ -287,7 +309,8 @@ class Volcano:
         return f"Volcano(id={self.id}, name='{self.name}', country='{self.country}')"
 
     def _wrap_text(self, text, line_length=80):
-        import textwrap
+        if line_length == _SUMMARY_WRAPPER.width:
+            return _SUMMARY_WRAPPER.wrap(text)
         return textwrap.wrap(text, width=line_length)
 
     def print(self):
@@ -302,13 +325,17 @@ class Volcano:
         1992 CE :
         """
 
-        print(f"{self.name.upper()} ({self.country}) | {self.id}")
-        print(f"{self.region}")
-        print(f"({self.lat}, {self.lon}, {self.elev})")
-        print(f"{self.tectonic_setting} | {self.volcano_type}")
-        print(f"{self.major_rock_type}")
-        print(f"Last Known Eruption: {int(self.last_eruption_year)}")
-        print("Geologic Summary:")
-        geo_sum = self._wrap_text(self.geological_summary)
-        [print(" ", line) for line in geo_sum]
-        print()
+        last_year = self.last_eruption_year
+        last_eruption = f"{int(last_year)}" if last_year is not None else "Unknown"
+        # Build all lines first and write them in one call
+        lines = [
+            f"{self.name.upper()} ({self.country}) | {self.id}",
+            f"{self.region}",
+            f"({self.lat}, {self.lon}, {self.elev})",
+            f"{self.tectonic_setting} | {self.volcano_type}",
+            f"{self.major_rock_type}",
+            f"Last Known Eruption: {last_eruption}",
+            "Geologic Summary:",
+        ]
+        lines.extend(f"  {line}" for line in self._wrap_text(self.geological_summary))
+        sys.stdout.write("\n".join(lines) + "\n\n")
@@ -1,23 +1,109 @@
 # File: volcanoes/core/volcano_set.py
-from typing import List, Optional, Union, Iterator
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Callable, List, Optional, Union, Iterator
+import logging
 import math
+import sys
+
+import numpy as np
+
+from ..utils.distance import EARTH_RADIUS_KM, haversine_km_radians, numba_kernel
+from ..utils.views import ListView
+from ..utils.csv_writer import write_dict_rows
+from ..utils.geojson import write_feature_collection
+from ..utils.plotting import get_tiler, get_zoom_level_interpolated
+
+logger = logging.getLogger(__name__)
+
+FILTER_CACHE_SIZE = 128  # Filter results remembered per VolcanoSet
+DISTANCE_CACHE_SIZE = 8  # Query points whose distance arrays are remembered per VolcanoSet
+_NO_INDICES = np.empty(0, dtype=np.intp)
+
+
+def _as_float(value) -> float:
+    """Return value as a float, or NaN if it is missing or non-numeric."""
+    return float(value) if isinstance(value, (int, float)) else np.nan
+
+
+@lru_cache(maxsize=4096)
+def _lower_key(value: Optional[str]) -> str:
+    """Lowercased, interned form of a categorical string such as a country.
+
+    Memoized, so each distinct value is lowercased once no matter how many
+    volcanoes or VolcanoSets share it; interning makes equal keys identical
+    objects, which speeds up the dict lookups in the indexes.
+    """
+    return sys.intern((value or '').lower())
+
+
+def _elevation_mask(elevs: np.ndarray, lo: float, hi: float, mask: np.ndarray) -> None:
+    """Clear mask where the elevation is outside [lo, hi] or unknown (NaN), in one pass."""
+    for i in range(elevs.shape[0]):
+        if mask[i]:
+            e = elevs[i]
+            mask[i] = e >= lo and e <= hi
+
+
+def _elevation_mask_kernel() -> Optional[Callable]:
+    """Get _elevation_mask compiled with numba, or None without numba.
+
+    The loop is too slow in pure Python, where the NumPy comparisons in
+    _filter_mask are used instead. No fastmath: it would break the NaN
+    comparisons.
+    """
+    return numba_kernel(_elevation_mask)
 
 
 class VolcanoSet:
     """A collection of volcanoes with filtering and analysis methods."""
 
+    __slots__ = ('_volcanoes', '_lat_arr', '_lon_arr', '_elev_arr', '_last_year_arr', '_radians',
+                 '_elev_order', '_lat_order', '_by_country', '_by_type', '_by_epoch', '_by_id',
+                 '_names_lc', '_distinct_counts', '_filter_cache', '_distance_cache')
+
     def __init__(self, volcanoes: List['Volcano']):
         """Initialize with a list of Volcano objects."""
         self._volcanoes = volcanoes
+        # Column arrays (structure-of-arrays view of the volcanoes), built on first use
+        self._lat_arr = None
+        self._lon_arr = None
+        self._elev_arr = None
+        self._last_year_arr = None
+        # (lat_rad, lon_rad, cos_lat) for the distance calculations, built on first query
+        self._radians = None
+        # (argsort of elevations, sorted known elevations) for range queries, built on first query
+        self._elev_order = None
+        # (argsort of latitudes, sorted known latitudes) for radius queries, built on first query
+        self._lat_order = None
+        # Inverted indexes: lowercased country/type/epoch -> indices of matching volcanoes
+        self._by_country = None
+        self._by_type = None
+        self._by_epoch = None
+        # Volcano number -> indices, built on first id lookup
+        self._by_id = None
+        # Lowercased names (unicode array) for name searches, built on first search
+        self._names_lc = None
+        # (distinct countries, distinct types), case-sensitive, counted on first summary_stats()
+        self._distinct_counts = None
+        # Memoized filter results, keyed by (filter name, *normalized args)
+        self._filter_cache = OrderedDict()
+        # Distance arrays from recent query points, keyed by (lat, lon)
+        self._distance_cache = OrderedDict()
 
     def __len__(self) -> int:
         """Return the number of volcanoes in the set."""
         return len(self._volcanoes)
 
     def __getitem__(self, index: Union[int, slice]) -> Union['Volcano', 'VolcanoSet']:
-        """Get volcano(es) by index."""
+        """Get volcano(es) by index.
+
+        Slices are views that share the underlying list rather than copying it.
+        """
         if isinstance(index, slice):
-            return VolcanoSet(self._volcanoes[index])
+            subset = VolcanoSet(ListView(self._volcanoes, index))
+            subset._inherit_arrays(self, index)
+            return subset
         return self._volcanoes[index]
 
     def __iter__(self) -> Iterator['Volcano']:
@@ -26,32 +112,238 @@ class VolcanoSet:
 
     @property
     def volcanoes(self) -> List['Volcano']:
-        """Get the list of volcanoes."""
-        return self._volcanoes
+        """Get a copy of the list of volcanoes.
+
+        The set's own list backs its column arrays, indexes and caches, so
+        changing the returned list does not change the set.
+        """
+        return list(self._volcanoes)
+
+    def _build_arrays(self):
+        """Build the column arrays used by the vectorized filters and statistics.
+
+        Numeric columns are float64, with NaN for missing values.
+        """
+        if self._lat_arr is not None:
+            return
+        rows = [(v.lat, v.lon, v.elevation, v.last_eruption_year) for v in self._volcanoes]
+        try:
+            # One pass over the volcanoes, one bulk conversion (None -> NaN)
+            columns = np.array(rows, dtype=np.float64).reshape(len(rows), 4).T
+        except (TypeError, ValueError):
+            # Some value is not numeric (e.g. data not loaded through Volcano)
+            rows = [[_as_float(x) for x in row] for row in rows]
+            columns = np.array(rows, dtype=np.float64).reshape(len(rows), 4).T
+        self._lat_arr = columns[0].copy()
+        self._lon_arr = columns[1].copy()
+        self._elev_arr = columns[2].copy()
+        self._last_year_arr = columns[3].copy()
+
+    def _build_indexes(self):
+        """Build the country, volcano type and geologic epoch inverted indexes in a single pass."""
+        if self._by_country is not None:
+            return
+        by_country = {}
+        by_type = {}
+        by_epoch = {}
+        for i, v in enumerate(self._volcanoes):
+            by_country.setdefault(_lower_key(v.country), []).append(i)
+            by_type.setdefault(_lower_key(v.volcano_type), []).append(i)
+            by_epoch.setdefault(_lower_key(v.geologic_epoch), []).append(i)
+        self._by_country = {k: np.array(idx) for k, idx in by_country.items()}
+        self._by_type = {k: np.array(idx) for k, idx in by_type.items()}
+        self._by_epoch = {k: np.array(idx) for k, idx in by_epoch.items()}
+
+    def _contains_mask(self, index: dict, needle: str) -> np.ndarray:
+        """Mask of volcanoes whose indexed value contains needle (case-insensitive).
+
+        Only the distinct values in the index are compared.
+        """
+        needle = needle.lower()
+        mask = np.zeros(len(self._volcanoes), dtype=bool)
+        for key, idx in index.items():
+            if needle in key:
+                mask[idx] = True
+        return mask
+
+    def _filter_mask(self,
+                     country: Optional[str] = None,
+                     name: Optional[str] = None,
+                     id: Optional[int] = None,
+                     volcano_type: Optional[str] = None,
+                     geologic_epoch: Optional[str] = None,
+                     min_elevation: Optional[float] = None,
+                     max_elevation: Optional[float] = None) -> np.ndarray:
+        """Boolean mask of the volcanoes matching all the given criteria.
+
+        String criteria are case-insensitive partial matches, and volcanoes
+        with unknown elevation fail any elevation criterion.
+        """
+        # Most selective and cheapest criteria first; stop once nothing is left
+        if id is not None:
+            mask = np.zeros(len(self._volcanoes), dtype=bool)
+            mask[self._id_index().get(id, _NO_INDICES)] = True
+        else:
+            mask = np.ones(len(self._volcanoes), dtype=bool)
+        if country or volcano_type or geologic_epoch:
+            self._build_indexes()
+        for index, needle in ((self._by_country, country), (self._by_type, volcano_type),
+                              (self._by_epoch, geologic_epoch)):
+            if needle and mask.any():
+                mask &= self._contains_mask(index, needle)
+        if (min_elevation is not None or max_elevation is not None) and mask.any():
+            self._build_arrays()
+            elevs = self._elev_arr
+            # NaN (unknown elevation) compares False, so no separate isnan pass is needed
+            kernel = _elevation_mask_kernel()
+            if kernel is not None:
+                kernel(elevs,
+                       -np.inf if min_elevation is None else float(min_elevation),
+                       np.inf if max_elevation is None else float(max_elevation),
+                       mask)
+            else:
+                if min_elevation is not None:
+                    mask &= elevs >= min_elevation
+                if max_elevation is not None:
+                    mask &= elevs <= max_elevation
+        if name:
+            # Per-row test, so only for the volcanoes still matching
+            if self._names_lc is None:
+                # Fixed-width unicode array, so the substring search runs as one C loop
+                self._names_lc = np.array([v.name.lower() for v in self._volcanoes], dtype=str)
+            survivors = np.flatnonzero(mask)
+            mask[survivors] = np.char.find(self._names_lc[survivors], name.lower()) >= 0
+        return mask
+
+    def _id_index(self) -> dict:
+        """Get the volcano number -> indices map, built on first use."""
+        if self._by_id is None:
+            by_id = {}
+            for i, v in enumerate(self._volcanoes):
+                if v.id is not None:
+                    by_id.setdefault(v.id, []).append(i)
+            self._by_id = {k: np.array(idx) for k, idx in by_id.items()}
+        return self._by_id
+
+    def _inherit_arrays(self, parent: 'VolcanoSet', index):
+        """Reuse the parent's column arrays (if built) for a subset of it."""
+        if parent._lat_arr is not None:
+            self._lat_arr = parent._lat_arr[index]
+            self._lon_arr = parent._lon_arr[index]
+            self._elev_arr = parent._elev_arr[index]
+            self._last_year_arr = parent._last_year_arr[index]
+        if parent._radians is not None:
+            self._radians = tuple(arr[index] for arr in parent._radians)
+
+    def _take(self, idx: np.ndarray) -> 'VolcanoSet':
+        """Create a new VolcanoSet from an array of indices into this set."""
+        subset = VolcanoSet([self._volcanoes[i] for i in idx])
+        subset._inherit_arrays(self, idx)
+        return subset
+
+    def _cached(self, key: tuple, compute: Callable[[], 'VolcanoSet']) -> 'VolcanoSet':
+        """Return the memoized result for key, computing it on a miss.
+
+        VolcanoSets cannot be modified after construction (``volcanoes``
+        returns a copy), so results stay valid for the lifetime of the set. The cache keeps the most recently used
+        FILTER_CACHE_SIZE entries. Each call gets a fresh view of the memoized
+        result, so callers cannot change it (or each other's results) through
+        the set they get back.
+        """
+        cache = self._filter_cache
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = compute()
+            if len(cache) > FILTER_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return result[:]
+
+    def _radian_arrays(self):
+        """Get (lat_rad, lon_rad, cos_lat) arrays, computed once per set.
+
+        Repeated distance queries against the same set then only evaluate the
+        trigonometry that depends on the query point.
+        """
+        if self._radians is None:
+            self._build_arrays()
+            lat_rad = np.radians(self._lat_arr)
+            self._radians = (lat_rad, np.radians(self._lon_arr), np.cos(lat_rad))
+        return self._radians
+
+    def _distances(self, lat: float, lon: float) -> np.ndarray:
+        """Get the distance in km from a point to every volcano (NaN if no coordinates).
+
+        The arrays of the DISTANCE_CACHE_SIZE most recent query points are
+        kept, so sort_by_distance, nearest and within_radius at the same point
+        share one haversine pass.
+        """
+        cache = self._distance_cache
+        key = (lat, lon)
+        d = cache.get(key)
+        if d is None:
+            d = cache[key] = haversine_km_radians(lat, lon, *self._radian_arrays())
+            if len(cache) > DISTANCE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return d
 
     def filter_by_country(self, country: str) -> 'VolcanoSet':
         """Filter volcanoes by country."""
-        filtered = [v for v in self._volcanoes if v.country.lower() == country.lower()]
-        return VolcanoSet(filtered)
+        key = _lower_key(country)
+        return self._cached(('country', key), lambda: self._filter_by_country(key))
+
+    def _filter_by_country(self, key: str) -> 'VolcanoSet':
+        self._build_indexes()
+        return self._take(self._by_country.get(key, _NO_INDICES))
 
     def filter_by_type(self, volcano_type: str) -> 'VolcanoSet':
         """Filter volcanoes by type."""
-        filtered = [v for v in self._volcanoes if volcano_type.lower() in v.volcano_type.lower()]
-        return VolcanoSet(filtered)
+        key = _lower_key(volcano_type)
+        return self._cached(('type', key), lambda: self._filter_by_type(key))
+
+    def _filter_by_type(self, key: str) -> 'VolcanoSet':
+        self._build_indexes()
+        # Substring match against the distinct types only, then merge their indices
+        matches = [idx for vtype, idx in self._by_type.items() if key in vtype]
+        if not matches:
+            return VolcanoSet([])
+        return self._take(np.sort(np.concatenate(matches)))
 
     def filter_by_elevation_range(self, min_elev: float, max_elev: float) -> 'VolcanoSet':
         """Filter volcanoes by elevation range."""
-        filtered = []
-        for v in self._volcanoes:
-            elev = v.get_elevation()
-            if elev is not None and min_elev <= elev <= max_elev:
-                filtered.append(v)
-        return VolcanoSet(filtered)
+        return self._cached(('elevation', min_elev, max_elev),
+                            lambda: self._filter_by_elevation_range(min_elev, max_elev))
+
+    def _filter_by_elevation_range(self, min_elev: float, max_elev: float) -> 'VolcanoSet':
+        order, sorted_elevs = self._sorted_elevations()
+        lo = np.searchsorted(sorted_elevs, min_elev, side='left')
+        hi = np.searchsorted(sorted_elevs, max_elev, side='right')
+        # Keep the set's original order
+        return self._take(np.sort(order[lo:hi]))
+
+    def _sorted_elevations(self):
+        """Get (order, sorted_elevs): the argsort of the elevations and the known
+        elevations in that order, so range queries are two binary searches.
+
+        Unknown elevations (NaN) sort last and are left out of sorted_elevs.
+        """
+        if self._elev_order is None:
+            self._build_arrays()
+            order = np.argsort(self._elev_arr, kind='stable')
+            sorted_elevs = self._elev_arr[order]
+            self._elev_order = (order, sorted_elevs[:np.count_nonzero(~np.isnan(sorted_elevs))])
+        return self._elev_order
 
     def sort_by_distance(self, lat: float, lon: float) -> 'VolcanoSet':
         """Sort volcanoes by distance from a point."""
-        sorted_volcanoes = sorted(self._volcanoes, key=lambda v: v.distance_to(lat, lon))
-        return VolcanoSet(sorted_volcanoes)
+        return self._cached(('distance', lat, lon), lambda: self._sort_by_distance(lat, lon))
+
+    def _sort_by_distance(self, lat: float, lon: float) -> 'VolcanoSet':
+        # Stable sort; volcanoes without coordinates (NaN) go last
+        return self._take(np.argsort(self._distances(lat, lon), kind='stable'))
 
     def sort_by_elevation(self, reverse: bool = True) -> 'VolcanoSet':
         """Sort volcanoes by elevation.
@@ -59,45 +351,126 @@ class VolcanoSet:
         Args:
             reverse: If True, sort descending (highest first). If False, sort ascending.
         """
-        sorted_volcanoes = sorted(
-            self._volcanoes,
-            key=lambda v: v.get_elevation() if v.get_elevation() is not None else float('-inf'),
-            reverse=reverse
-        )
-        return VolcanoSet(sorted_volcanoes)
-
-    def within_radius(self, lat: float, lon: float, radius_km: float) -> 'VolcanoSet':
-        """Get volcanoes within a radius of a point."""
-        filtered = [v for v in self._volcanoes if v.distance_to(lat, lon) <= radius_km]
-        return VolcanoSet(filtered)
+        self._build_arrays()
+        # Unknown elevations sort as -inf (last when descending, first when ascending)
+        keys = np.where(np.isnan(self._elev_arr), -np.inf, self._elev_arr)
+        return self._take(np.argsort(-keys if reverse else keys, kind='stable'))
+
+    def within_radius(self, lat: float, lon: float, radius_km: float, sort: bool = False) -> 'VolcanoSet':
+        """Get volcanoes within a radius of a point.
+
+        Args:
+            sort: If True, order the result by distance from the point (nearest
+                first). This reuses the distances computed for the radius test,
+                so it is cheaper than calling sort_by_distance() afterwards.
+        """
+        return self._cached(('radius', lat, lon, radius_km, sort),
+                            lambda: self._within_radius(lat, lon, radius_km, sort))
+
+    def _within_radius(self, lat: float, lon: float, radius_km: float, sort: bool) -> 'VolcanoSet':
+        self._build_arrays()
+        # Cheap bounding-box test first; exact haversine only for the candidates
+        candidates = self._bounding_box_candidates(lat, lon, radius_km)
+        distances = self._distance_cache.get((lat, lon))
+        if distances is not None:
+            # Already computed for this point by another distance query
+            d = distances[candidates]
+        else:
+            d = haversine_km_radians(lat, lon, *(arr[candidates] for arr in self._radian_arrays()))
+        inside = d <= radius_km
+        candidates = candidates[inside]
+        if sort:
+            # Decorate-sort-undecorate: the distances are the precomputed sort keys
+            candidates = candidates[np.argsort(d[inside], kind='stable')]
+        return self._take(candidates)
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> 'VolcanoSet':
+        """Get the k volcanoes nearest to a point, nearest first.
+
+        Volcanoes without coordinates are left out. Only the k nearest are
+        sorted, so this is cheaper than sort_by_distance()[:k] on large sets.
+        """
+        return self._cached(('nearest', lat, lon, k), lambda: self._nearest(lat, lon, k))
+
+    def _nearest(self, lat: float, lon: float, k: int) -> 'VolcanoSet':
+        d = self._distances(lat, lon)
+        known = np.flatnonzero(~np.isnan(d))
+        k = max(0, min(k, len(known)))
+        if k < len(known):
+            # Partial selection of the k smallest distances, in linear time
+            known = known[np.argpartition(d[known], k - 1)[:k]] if k else _NO_INDICES
+        return self._take(known[np.argsort(d[known], kind='stable')])
+
+    def _bounding_box_candidates(self, lat: float, lon: float, radius_km: float) -> np.ndarray:
+        """Indices (ascending) of volcanoes inside the lat/lon box enclosing a circle on the sphere.
+
+        The box is exact for a great circle radius, so no volcano within
+        radius_km is ever rejected. The latitude band is found by binary
+        search on the sorted latitudes, so only volcanoes in the band are
+        looked at. Longitudes are compared modulo 360.
+        """
+        order, sorted_lats = self._sorted_latitudes()
+        angle = radius_km / EARTH_RADIUS_KM  # angular radius in radians
+        dlat = math.degrees(angle) + 1e-9
+        lo = np.searchsorted(sorted_lats, lat - dlat, side='left')
+        hi = np.searchsorted(sorted_lats, lat + dlat, side='right')
+        candidates = order[lo:hi]
+
+        # Longitude half-width; unbounded when the circle reaches a pole
+        sin_angle = math.sin(min(angle, math.pi / 2))
+        cos_lat = math.cos(math.radians(lat))
+        if angle < math.pi / 2 and sin_angle < cos_lat:
+            dlon = math.degrees(math.asin(sin_angle / cos_lat)) + 1e-9
+            candidates = candidates[np.abs((self._lon_arr[candidates] - lon + 180) % 360 - 180) <= dlon]
+        # Back to the set's order
+        return np.sort(candidates)
+
+    def _sorted_latitudes(self):
+        """Get (order, sorted_lats): the argsort of the latitudes and the known
+        latitudes in that order. Volcanoes without coordinates are left out.
+        """
+        if self._lat_order is None:
+            self._build_arrays()
+            known = np.flatnonzero(~np.isnan(self._lat_arr) & ~np.isnan(self._lon_arr))
+            order = known[np.argsort(self._lat_arr[known], kind='stable')]
+            self._lat_order = (order, self._lat_arr[order])
+        return self._lat_order
 
     def get_lats(self):
-        return [v.lat for v in self._volcanoes if v.lat is not None]
+        self._build_arrays()
+        return self._lat_arr[~np.isnan(self._lat_arr)].tolist()
 
     def get_lons(self):
-        return [v.lon for v in self._volcanoes if v.lon is not None]
+        self._build_arrays()
+        return self._lon_arr[~np.isnan(self._lon_arr)].tolist()
 
     def get_elevs(self):
-        return [v.elev for v in self._volcanoes if v.elev is not None]
+        self._build_arrays()
+        return self._elev_arr[~np.isnan(self._elev_arr)].tolist()
 
     def print(self, limit: Optional[int] = None):
         """Print information about volcanoes in the set."""
         volcs_to_print = self._volcanoes[:limit] if limit else self._volcanoes
 
-        print(f"VolcanoSet with {len(self._volcanoes)} volcanoes:")
-        print("-" * 80)
+        # Build all lines first and write them in one call
+        lines = [f"VolcanoSet with {len(self._volcanoes)} volcanoes:", "-" * 80]
 
+        append = lines.append
         for i, volcano in enumerate(volcs_to_print):
-            elev_str = f"{volcano.get_elevation() :4.0f}m" if volcano.get_elevation() else "----m"
+            # Look up each property once per row
+            elev = volcano.elevation
+            last_year = volcano.last_eruption_year
+            elev_str = f"{elev :4.0f}m" if elev else "----m"
             origin_str = f"{volcano.lat:>+6.3f}, {volcano.lon:>+7.3f}, {elev_str}"
-            elev_str = f"{volcano.get_elevation() :.0f}m" if volcano.get_elevation() else "Unknown"
-            last_eruption = f"{int(volcano.last_eruption_year)}" if volcano.last_eruption_year else "Unknown"
+            last_eruption = f"{int(last_year)}" if last_year else "Unknown"
 
-            print(f"{i + 1:3d}. {volcano.name:<30} | {volcano.country:<15} | "
-                  f"{origin_str:>22} | Last: {last_eruption}")
+            append(f"{i + 1:3d}. {volcano.name:<30} | {volcano.country:<15} | "
+                   f"{origin_str:>22} | Last: {last_eruption}")
 
         if limit and len(self._volcanoes) > limit:
-            print(f"... and {len(self._volcanoes) - limit} more")
+            lines.append(f"... and {len(self._volcanoes) - limit} more")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def simple_plot(self):
         """Plot all volcanoes in the set on a simple map."""
@@ -111,11 +484,13 @@ class VolcanoSet:
             print("No volcanoes to plot")
             return
 
-        # Get coordinates of all volcanoes
-        lats = [v.lat for v in self._volcanoes if v.lat is not None]
-        lons = [v.lon for v in self._volcanoes if v.lon is not None]
+        # Get coordinates of all volcanoes with a valid location
+        self._build_arrays()
+        valid = ~np.isnan(self._lat_arr) & ~np.isnan(self._lon_arr)
+        lats = self._lat_arr[valid]
+        lons = self._lon_arr[valid]
 
-        if not lats or not lons:
+        if not lats.size:
             print("No volcanoes with valid coordinates to plot")
             return
 
@@ -126,12 +501,12 @@ class VolcanoSet:
                    alpha=0.8, edgecolors='black', linewidth=0.8)
 
         # Set map extent with some padding
-        lat_range = max(lats) - min(lats)
-        lon_range = max(lons) - min(lons)
-        padding = max(lat_range, lon_range) * 0.1
+        lat_min, lat_max = lats.min(), lats.max()
+        lon_min, lon_max = lons.min(), lons.max()
+        padding = max(lat_max - lat_min, lon_max - lon_min) * 0.1
 
-        ax.set_xlim(min(lons) - padding, max(lons) + padding)
-        ax.set_ylim(min(lats) - padding, max(lats) + padding)
+        ax.set_xlim(lon_min - padding, lon_max + padding)
+        ax.set_ylim(lat_min - padding, lat_max + padding)
 
         # Add grid and labels
         ax.grid(True, alpha=0.3)
@@ -140,9 +515,9 @@ class VolcanoSet:
         ax.set_title(f'Volcano Locations ({len(self._volcanoes)} volcanoes)')
 
         # Add country info if all from same country
-        countries = list(set(v.country for v in self._volcanoes))
-        if len(countries) == 1:
-            ax.set_title(f'Volcanoes in {countries[0]} ({len(self._volcanoes)} volcanoes)')
+        self._build_indexes()
+        if len(self._by_country) == 1:
+            ax.set_title(f'Volcanoes in {self._volcanoes[0].country} ({len(self._volcanoes)} volcanoes)')
 
         plt.tight_layout()
         plt.show()
@@ -151,50 +526,48 @@ class VolcanoSet:
 
         try:
             import matplotlib.pyplot as plt
-            import matplotlib.patches as patches
             import cartopy.crs as ccrs
-            from cartopy.io.img_tiles import GoogleTiles
         except ImportError:
             print("Matplotlib and Cartopy are required for advanced plotting. Install with: pip install matplotlib")
             self.simple_plot()
             return
 
-        import numpy as np
-        from volcanoes.utils.plotting import get_zoom_level_interpolated
-
         if not self._volcanoes:
             print("No volcanoes to plot")
             return
 
-        # Get coordinates of all volcanoes
-        lats = [v.lat for v in self._volcanoes if v.lat is not None]
-        lons = [v.lon for v in self._volcanoes if v.lon is not None]
+        # Get coordinates of all volcanoes with a valid location
+        self._build_arrays()
+        valid = ~np.isnan(self._lat_arr) & ~np.isnan(self._lon_arr)
+        lats = self._lat_arr[valid]
+        lons = self._lon_arr[valid]
 
-        if not lats or not lons:
+        if not lats.size:
             print("No volcanoes with valid coordinates to plot")
             return
 
         # Set map extent with some padding
-        lat_range = max(lats) - min(lats)
-        lon_range = max(lons) - min(lons)
+        lat_min, lat_max = lats.min(), lats.max()
+        lon_min, lon_max = lons.min(), lons.max()
+        lat_range = lat_max - lat_min
+        lon_range = lon_max - lon_min
         padding = max(lat_range, lon_range) * 0.1
 
         # Convert degrees to kilometers: 1 degree ≈ 111.32 km
         # For longitude, account for latitude: 1 degree longitude ≈ 111.32 * cos(lat) km
-        avg_lat = np.radians(np.mean(lats))
+        avg_lat = np.radians(lats.mean())
         lat_range_km = lat_range * 111.32
         lon_range_km = lon_range * 111.32 * np.cos(avg_lat)
         extent_km = np.maximum(lat_range_km, lon_range_km)
         zoom_level = get_zoom_level_interpolated(extent_km)
 
-        tiler = GoogleTiles(style="satellite")
-        # tiler = GoogleTiles(style="terrain")  # "street" works, "terrain" appears not to work
+        tiler = get_tiler()
         mercator = tiler.crs
 
         fig = plt.figure()
         ax = fig.add_subplot(1, 1, 1, projection=mercator)
-        ax.set_extent([min(lons) - padding, max(lons) + padding,
-                       min(lats) - padding, max(lats) + padding],
+        ax.set_extent([lon_min - padding, lon_max + padding,
+                       lat_min - padding, lat_max + padding],
                       crs=ccrs.PlateCarree())
         ax.add_image(tiler, zoom_level)
         # ax.coastlines('10m')
@@ -211,26 +584,51 @@ class VolcanoSet:
         plt.tight_layout()
 
         # Add country info if all from same country
-        countries = list(set(v.country for v in self._volcanoes))
-        if len(countries) == 1:
-            ax.set_title(f'Volcanoes in {countries[0]} ({len(self._volcanoes)} volcanoes)')
+        self._build_indexes()
+        if len(self._by_country) == 1:
+            ax.set_title(f'Volcanoes in {self._volcanoes[0].country} ({len(self._volcanoes)} volcanoes)')
 
         plt.tight_layout()
         plt.savefig("./volcano_set.png")
 
     def summary_stats(self) -> dict:
         """Get summary statistics for the volcano set."""
-        elevations = [v.get_elevation() for v in self._volcanoes if v.get_elevation() is not None]
-        countries = [v.country for v in self._volcanoes]
-        types = [v.volcano_type for v in self._volcanoes]
+        self._build_arrays()
+        elevations = self._elev_arr[~np.isnan(self._elev_arr)]
+        if self._distinct_counts is None:
+            countries = set()
+            types = set()
+            for v in self._volcanoes:
+                countries.add(v.country)
+                types.add(v.volcano_type)
+            self._distinct_counts = (len(countries), len(types))
+        n_countries, n_types = self._distinct_counts
+
+        return {
+            'total_volcanoes': len(self._volcanoes),
+            'countries': n_countries,
+            'volcano_types': n_types,
+            'avg_elevation': float(elevations.mean()) if elevations.size else None,
+            'max_elevation': float(elevations.max()) if elevations.size else None,
+            'min_elevation': float(elevations.min()) if elevations.size else None,
+        }
+
+    def counts_by_country(self) -> Counter:
+        """Count volcanoes per country in a single pass."""
+        return Counter(v.country for v in self._volcanoes if v.country)
+
+    def counts_by_type(self) -> Counter:
+        """Count volcanoes per volcano type in a single pass."""
+        return Counter(v.volcano_type for v in self._volcanoes if v.volcano_type)
 
+    def completeness(self) -> dict:
+        """Count how many volcanoes have coordinates, elevation and last eruption data."""
+        self._build_arrays()
         return {
             'total_volcanoes': len(self._volcanoes),
-            'countries': len(set(countries)),
-            'volcano_types': len(set(types)),
-            'avg_elevation': sum(elevations) / len(elevations) if elevations else None,
-            'max_elevation': max(elevations) if elevations else None,
-            'min_elevation': min(elevations) if elevations else None,
+            'with_coordinates': int((~np.isnan(self._lat_arr) & ~np.isnan(self._lon_arr)).sum()),
+            'with_elevation': int((~np.isnan(self._elev_arr)).sum()),
+            'with_last_eruption': int((~np.isnan(self._last_year_arr)).sum()),
         }
 
     def export_to_csv(self, output_path: str) -> str:
@@ -242,21 +640,15 @@ class VolcanoSet:
         Returns:
             Path to the exported file
         """
-        import csv
-        
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
             if not self._volcanoes:
                 return output_path
             
             # Get fieldnames from first volcano
             fieldnames = list(self._volcanoes[0]._data.keys())
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for volcano in self._volcanoes:
-                writer.writerow(volcano._data)
+            write_dict_rows(f, fieldnames, [volcano._data for volcano in self._volcanoes])
         
-        print(f"Exported {len(self._volcanoes)} volcanoes to CSV: {output_path}")
+        logger.info("Exported %d volcanoes to CSV: %s", len(self._volcanoes), output_path)
         return output_path
     
     def export_to_geojson(self, output_path: str) -> str:
@@ -268,30 +660,17 @@ class VolcanoSet:
         Returns:
             Path to the exported file
         """
-        import json
-        
-        features = []
-        for volcano in self._volcanoes:
-            if volcano.lat is None or volcano.lon is None:
-                continue
-            
-            feature = {
-                'type': 'Feature',
-                'geometry': {
-                    'type': 'Point',
-                    'coordinates': [volcano.lon, volcano.lat]
-                },
-                'properties': volcano._data.copy()
-            }
-            features.append(feature)
-        
-        geojson = {
-            'type': 'FeatureCollection',
-            'features': features
-        }
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(geojson, f, indent=2, ensure_ascii=False)
+        # Features are generated and written one at a time; the encoder only
+        # reads the data dicts, so they are not copied
+        features = ({
+            'type': 'Feature',
+            'geometry': {
+                'type': 'Point',
+                'coordinates': [volcano.lon, volcano.lat]
+            },
+            'properties': volcano._data
+        } for volcano in self._volcanoes if volcano.lat is not None and volcano.lon is not None)
+        count = write_feature_collection(features, output_path)
         
-        print(f"Exported {len(features)} volcanoes to GeoJSON: {output_path}")
+        logger.info("Exported %d volcanoes to GeoJSON: %s", count, output_path)
         return output_path
\ No newline at end of file
@@ -2,7 +2,7 @@
 Utility functions for the volcanoes package
 """
 
-from .distance import haversine_distance
+from .distance import haversine_distance, haversine_distance_vec
 from .plotting import check_matplotlib
 
-__all__ = ["haversine_distance", "check_matplotlib"]
\ No newline at end of file
+__all__ = ["haversine_distance", "haversine_distance_vec", "check_matplotlib"]
\ No newline at end of file
@@ -0,0 +1,202 @@
+"""Bulk CSV reading shared by the volcano and eruption loaders."""
+import codecs
+import csv
+import importlib.util
+import io
+import mmap
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# Only check availability here; pandas and pyarrow are imported when their
+# engine is used
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+ARROW_BLOCK_SIZE = 1 << 20  # 1 MiB blocks, tokenized in parallel by pyarrow
+
+
+def read_csv_records(csv_path: str, workers: int = 1,
+                     engine: str = 'csv') -> Tuple[List[str], List[Dict[str, str]]]:
+    """Read a CSV file into its header and one dict per row.
+
+    Header names and cell values are stripped of surrounding whitespace.
+    The header is cleaned once and rows are built with csv.reader and zip,
+    which is cheaper than csv.DictReader plus a per-row cleanup. Blank lines
+    are skipped and cells beyond the header are dropped.
+
+    Args:
+        csv_path: Path to the CSV file
+        workers: Number of processes to parse the rows with. Only worth it for
+            large files (tens of MB); the rows are split at row boundaries and
+            parsed in parallel, and the result is the same as with one process.
+        engine: 'csv' (default), 'pandas' or 'pyarrow'. The pandas engine
+            tokenizes in C and strips the cells column by column; it requires
+            pandas. The pyarrow engine also splits the file into blocks and
+            tokenizes them on several threads; it requires pyarrow.
+    """
+    if engine == 'pandas':
+        return _read_csv_records_pandas(csv_path)
+    if engine == 'pyarrow':
+        return _read_csv_records_pyarrow(csv_path)
+    if engine != 'csv':
+        raise ValueError(f"Unknown CSV engine: {engine!r} (expected 'csv', 'pandas' or 'pyarrow')")
+
+    # Map the file and decode it straight from the mapping in a single call,
+    # rather than copying it into a bytes object or reading it through a
+    # text-mode file chunk by chunk
+    with open(csv_path, 'rb') as file:
+        if not os.fstat(file.fileno()).st_size:
+            # mmap cannot map an empty file
+            return [], []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if workers > 1:
+                return _read_csv_records_parallel(data, workers)
+            text = str(data, 'utf-8-sig')
+
+    reader = csv.reader(io.StringIO(text, newline=''))
+    header = [name.strip() for name in next(reader, [])]
+    records = [dict(zip(header, map(str.strip, row))) for row in reader if row]
+    return header, records
+
+
+def _read_csv_records_pandas(csv_path: str) -> Tuple[List[str], List[Dict[str, str]]]:
+    """Read a CSV file like read_csv_records, tokenizing with pandas.
+
+    Unlike the csv engine, cells missing from short rows are filled with ''.
+    """
+    if not HAS_PANDAS:
+        raise ImportError("pandas is required for the pandas CSV engine. Install with: pip install pandas")
+    import pandas as pd
+
+    try:
+        df = pd.read_csv(csv_path, dtype=str, encoding='utf-8-sig', keep_default_na=False,
+                         na_filter=False, skip_blank_lines=True)
+    except pd.errors.EmptyDataError:
+        return [], []
+    header = [str(name).strip() for name in df.columns]
+    df.columns = header
+    for name in header:
+        df[name] = df[name].fillna('').str.strip()
+    return header, df.to_dict(orient='records')
+
+
+def _read_csv_records_pyarrow(csv_path: str) -> Tuple[List[str], List[Dict[str, str]]]:
+    """Read a CSV file like read_csv_records, tokenizing with pyarrow's threaded reader.
+
+    Unlike the csv engine, rows with more or fewer cells than the header are
+    an error.
+    """
+    if not HAS_PYARROW:
+        raise ImportError("pyarrow is required for the pyarrow CSV engine. Install with: pip install pyarrow")
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+
+    # Read every column as text, like the other engines; the column types can
+    # only be given by name, so take the raw names from the first row
+    with open(csv_path, encoding='utf-8-sig', newline='') as file:
+        names = next(csv.reader(file), [])
+    if not names:
+        return [], []
+
+    table = pacsv.read_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=ARROW_BLOCK_SIZE),
+        convert_options=pacsv.ConvertOptions(column_types={name: pa.string() for name in names},
+                                             strings_can_be_null=False,
+                                             quoted_strings_can_be_null=False),
+    )
+    header = [name.strip() for name in table.column_names]
+    columns = [pc.utf8_trim_whitespace(column).to_pylist() for column in table.columns]
+    return header, [dict(zip(header, row)) for row in zip(*columns)]
+
+
+def _parse_rows(data: bytes, header: List[str]) -> List[Dict[str, str]]:
+    """Parse CSV rows (without header) into cleaned dicts."""
+    reader = csv.reader(io.StringIO(data.decode('utf-8'), newline=''))
+    return [dict(zip(header, map(str.strip, row))) for row in reader if row]
+
+
+def _read_csv_records_parallel(data, workers: int) -> Tuple[List[str], List[Dict[str, str]]]:
+    """Parse the rows of CSV data in a process pool, in chunks of whole rows."""
+    starts, ends = _row_offsets(data)
+    if not len(starts):
+        return [], []
+    if data[:3] == codecs.BOM_UTF8:
+        starts[0] += 3
+    header = [name.strip() for name in next(csv.reader([data[starts[0]:ends[0]].decode('utf-8')]), [])]
+
+    # Contiguous groups of rows; quoted newlines never straddle two chunks
+    groups = [g for g in np.array_split(np.arange(1, len(starts)), workers) if len(g)]
+    chunks = [data[starts[g[0]]:ends[g[-1]]] for g in groups]
+    with ProcessPoolExecutor(max_workers=len(chunks) or 1) as executor:
+        parsed = executor.map(_parse_rows, chunks, [header] * len(chunks))
+        records = [record for chunk_records in parsed for record in chunk_records]
+    return header, records
+
+
+class LazyCSVRecords(Sequence):
+    """Read-only sequence of the rows of a CSV file, parsed on demand.
+
+    The file is memory-mapped and only the byte offsets of its rows are
+    computed up front (newlines inside quoted fields are not row breaks).
+    Indexing a row parses just that row into a dict, cleaned like
+    read_csv_records does.
+    """
+
+    __slots__ = ('header', '_file', '_buf', '_starts', '_ends')
+
+    def __init__(self, csv_path: str):
+        self._file = open(csv_path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        # mmap cannot map an empty file
+        self._buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        starts, ends = _row_offsets(self._buf)
+        if len(starts) and self._buf[:3] == codecs.BOM_UTF8:
+            starts[0] += 3
+        self.header = [name.strip() for name in self._parse(starts[0], ends[0])] if len(starts) else []
+        self._starts, self._ends = starts[1:], ends[1:]
+
+    def _parse(self, start: int, end: int) -> List[str]:
+        text = self._buf[start:end].decode('utf-8')
+        return next(csv.reader(io.StringIO(text)), [])
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        row = self._parse(int(self._starts[index]), int(self._ends[index]))
+        return dict(zip(self.header, map(str.strip, row)))
+
+    def close(self):
+        """Release the memory map and the file."""
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+        self._file.close()
+
+
+def _row_offsets(buf) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the start and end byte offsets of the non-blank rows of CSV data.
+
+    A newline ends a row only if an even number of quote characters comes
+    before it, so quoted fields may span lines. Both searches run in NumPy
+    over the raw bytes.
+    """
+    data = np.frombuffer(buf, dtype=np.uint8)
+    newlines = np.flatnonzero(data == ord('\n'))
+    quotes = np.flatnonzero(data == ord('"'))
+    newlines = newlines[np.searchsorted(quotes, newlines) % 2 == 0]
+
+    starts = np.concatenate(([0], newlines + 1)).astype(np.int64)
+    ends = np.concatenate((newlines, [len(data)])).astype(np.int64)
+    # Drop \r of \r\n line endings, then blank rows
+    has_cr = (ends > starts) & (data[np.maximum(ends - 1, 0)] == ord('\r')) if len(data) else ends > starts
+    ends = ends - has_cr
+    keep = ends > starts
+    return starts[keep], ends[keep]
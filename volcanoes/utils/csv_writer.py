@@ -0,0 +1,29 @@
+"""Bulk CSV writing shared by the export methods."""
+import csv
+from operator import itemgetter
+from typing import Any, Dict, List, Sequence, TextIO
+
+
+def write_dict_rows(file: TextIO, fieldnames: List[str], rows: Sequence[Dict[str, Any]]):
+    """Write a header and dict rows to an open CSV file, like csv.DictWriter.
+
+    When every row has exactly the header's keys (the normal case, as all rows
+    come from the same file), the values are pulled out with itemgetter and
+    written by a single writerows call. Otherwise this falls back to
+    csv.DictWriter, which fills missing keys with '' and rejects extra keys.
+    """
+    field_set = set(fieldnames)
+    if not all(row.keys() == field_set for row in rows):
+        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+        return
+
+    writer = csv.writer(file)
+    writer.writerow(fieldnames)
+    if len(fieldnames) == 1:
+        # itemgetter with one key returns the bare value, not a 1-tuple
+        name = fieldnames[0]
+        writer.writerows((row[name],) for row in rows)
+    else:
+        writer.writerows(map(itemgetter(*fieldnames), rows))
@@ -1,9 +1,45 @@
+import importlib.util
 import math
+from functools import lru_cache
+
+import numpy as np
+
+# Only check availability here; numba is imported when a kernel is first compiled
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+EARTH_RADIUS_KM = 6371  # Earth's radius in kilometers
+
+
+@lru_cache(maxsize=None)
+def numba_kernel(func):
+    """Return func compiled with numba, or None when numba is not installed.
+
+    numba is imported on the first call rather than with the package, and
+    each function is compiled once.
+    """
+    if not HAS_NUMBA:
+        return None
+    from numba import njit
+    return njit(cache=True)(func)
+
+
+def _haversine(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = math.radians(lat1), math.radians(lon1), math.radians(lat2), math.radians(lon2)
+
+    # Haversine formula
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+    c = 2 * math.asin(math.sqrt(a))
+
+    return EARTH_RADIUS_KM * c
 
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate the great circle distance between two points using Haversine formula.
 
+    Uses a numba-compiled kernel when numba is installed.
+
     Args:
         lat1, lon1: Latitude and longitude of first point in decimal degrees
         lat2, lon2: Latitude and longitude of second point in decimal degrees
@@ -11,15 +47,38 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         Distance in kilometers
     """
-    R = 6371  # Earth's radius in kilometers
+    # The pure Python version is the fallback without numba
+    haversine = numba_kernel(_haversine) or _haversine
+    return haversine(float(lat1), float(lon1), float(lat2), float(lon2))
 
-    # Convert to radians
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
 
-    # Haversine formula
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-    c = 2 * math.asin(math.sqrt(a))
+def haversine_distance_vec(lat1: float, lon1: float, lats, lons) -> np.ndarray:
+    """Calculate the great circle distances from one point to many points at once.
+
+    Vectorized with NumPy, so there is no per-point Python call.
+
+    Args:
+        lat1, lon1: Latitude and longitude of the point in decimal degrees
+        lats, lons: Array-likes of latitudes and longitudes in decimal degrees
+
+    Returns:
+        Array of distances in kilometers (NaN where a coordinate is NaN)
+    """
+    lat_rad = np.radians(np.asarray(lats, dtype=np.float64))
+    lon_rad = np.radians(np.asarray(lons, dtype=np.float64))
+    return haversine_km_radians(lat1, lon1, lat_rad, lon_rad, np.cos(lat_rad))
+
+
+def haversine_km_radians(lat: float, lon: float,
+                         lat_rad: np.ndarray, lon_rad: np.ndarray, cos_lat: np.ndarray) -> np.ndarray:
+    """Great circle distance (km) from one point to arrays of points.
+
+    The point is given in decimal degrees; the points are given in radians
+    together with the cosine of their latitude, so callers can precompute
+    them once for many queries. Missing coordinates (NaN) yield NaN distances.
+    """
+    lat1, lon1 = math.radians(lat), math.radians(lon)
 
-    return R * c
\ No newline at end of file
+    a = np.sin((lat_rad - lat1) / 2) ** 2 + math.cos(lat1) * cos_lat * np.sin((lon_rad - lon1) / 2) ** 2
+    # Clamp rounding error (a slightly above 1) for near-antipodal points
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(np.sqrt(a), 1.0))
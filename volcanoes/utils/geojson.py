@@ -0,0 +1,39 @@
+"""Streaming GeoJSON output."""
+from typing import Any, Dict, Iterable
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+if not HAS_ORJSON:
+    import json
+
+
+def _dumps(obj: Dict[str, Any]) -> str:
+    """Serialize obj as JSON with a 2-space indent, non-ASCII characters kept as is."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def write_feature_collection(features: Iterable[Dict[str, Any]], output_path: str) -> int:
+    """Write features to a GeoJSON FeatureCollection file, one feature at a time.
+
+    The output matches json.dump(collection, indent=2, ensure_ascii=False), but
+    the collection is never held in memory as a whole. orjson is used for the
+    encoding when installed.
+
+    Returns:
+        The number of features written
+    """
+    count = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write('{\n  "type": "FeatureCollection",\n  "features": [')
+        for feature in features:
+            f.write(',\n    ' if count else '\n    ')
+            f.write(_dumps(feature).replace('\n', '\n    '))
+            count += 1
+        f.write('\n  ]\n}' if count else ']\n}')
+    return count
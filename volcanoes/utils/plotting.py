@@ -1,11 +1,12 @@
 # File: volcanoes/utils/plotting.py
 """Plotting utilities for volcano visualization."""
+import importlib.util
+from bisect import bisect_left
 
-try:
-    import matplotlib.pyplot as plt
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+import numpy as np
+
+# Only check availability here; pyplot is imported by the plot methods when needed
+HAS_MATPLOTLIB = importlib.util.find_spec("matplotlib") is not None
 
 def check_matplotlib():
     """Check if matplotlib is available."""
@@ -13,6 +14,26 @@ def check_matplotlib():
         raise ImportError("Matplotlib is required for plotting. Install with: pip install matplotlib")
 
 
+def get_tiler(style="satellite"):
+    """Get the Google map tiler used by the plot methods.
+
+    Tiles are cached on disk in cartopy's cache directory
+    (cartopy.config['cache_dir']), so plotting the same area again reads them
+    from disk instead of fetching them. Cartopy versions before 0.21 have no
+    tile cache and fetch the tiles every time.
+
+    Args:
+        style (str): Tile style, e.g. "satellite" or "street" ("terrain"
+            appears not to work)
+    """
+    from cartopy.io.img_tiles import GoogleTiles
+
+    try:
+        return GoogleTiles(style=style, cache=True)
+    except TypeError:
+        return GoogleTiles(style=style)
+
+
 # Dictionary mapping extent_km to appropriate zoom levels for Google Tiles
 ZOOM_LEVELS = {
     # Very close up - building/structure level detail
@@ -41,6 +62,10 @@ ZOOM_LEVELS = {
     10000.0: 4,  # ~10000km extent
 }
 
+# The extents in ascending order and their zoom levels, for the lookups below
+_ZOOM_EXTENTS = tuple(sorted(ZOOM_LEVELS))
+_ZOOM_VALUES = tuple(ZOOM_LEVELS[extent] for extent in _ZOOM_EXTENTS)
+
 
 def get_zoom_level_basic(extent_km):
     """
@@ -52,9 +77,16 @@ def get_zoom_level_basic(extent_km):
     Returns:
         int: Zoom level (4-18)
     """
-    # Find the closest extent key
-    closest_extent = min(ZOOM_LEVELS.keys(), key=lambda x: abs(x - extent_km))
-    return ZOOM_LEVELS[closest_extent]
+    # Binary search for the neighbouring extents and take the closer one
+    # (the smaller on a tie)
+    i = bisect_left(_ZOOM_EXTENTS, extent_km)
+    if i == 0:
+        return _ZOOM_VALUES[0]
+    if i == len(_ZOOM_EXTENTS):
+        return _ZOOM_VALUES[-1]
+    if extent_km - _ZOOM_EXTENTS[i - 1] <= _ZOOM_EXTENTS[i] - extent_km:
+        i -= 1
+    return _ZOOM_VALUES[i]
 
 
 # Alternative function for more precise interpolation
@@ -68,17 +100,12 @@ def get_zoom_level_interpolated(extent_km):
     Returns:
         int: Zoom level (4-18)
     """
-    import numpy as np
-
-    extents = sorted(ZOOM_LEVELS.keys())
-    zooms = [ZOOM_LEVELS[ext] for ext in extents]
-
     # Clamp to bounds
-    if extent_km <= extents[0]:
-        return zooms[0]
-    elif extent_km >= extents[-1]:
-        return zooms[-1]
+    if extent_km <= _ZOOM_EXTENTS[0]:
+        return _ZOOM_VALUES[0]
+    elif extent_km >= _ZOOM_EXTENTS[-1]:
+        return _ZOOM_VALUES[-1]
 
     # Linear interpolation and round to nearest integer
-    zoom = np.interp(extent_km, extents, zooms)
+    zoom = np.interp(extent_km, _ZOOM_EXTENTS, _ZOOM_VALUES)
     return int(round(zoom))
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""Lightweight sequence views used by the collection classes."""
+from collections.abc import Sequence
+from itertools import islice
+
+
+class ListView(Sequence):
+    """Read-only view of a slice of a list, without copying the list.
+
+    Slicing a view returns another view onto the same underlying list.
+    """
+
+    __slots__ = ('_items', '_range')
+
+    def __init__(self, items, index: slice):
+        if isinstance(items, ListView):
+            # Flatten views of views onto the original list
+            self._items = items._items
+            self._range = items._range[index]
+        else:
+            self._items = items
+            self._range = range(len(items))[index]
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ListView(self, index)
+        return self._items[self._range[index]]
+
+    def __iter__(self):
+        r = self._range
+        if r.step == 1:
+            return islice(self._items, r.start, r.stop)
+        return (self._items[i] for i in r)
+
+    def __repr__(self) -> str:
+        return f"ListView({list(self)!r})"